@@ -45,7 +45,14 @@ create table if not exists reminders (
 );
 
 -- Indexes for performance
-create index if not exists idx_todos_user_id on todos(user_id);
-create index if not exists idx_calendar_events_user_id on calendar_events(user_id);
-create index if not exists idx_reminders_user_id on reminders(user_id);
+-- Composite indexes match the tool queries (filter on user_id plus status/is_sent,
+-- ordered by time); their leading user_id column also serves plain user_id lookups
+create index if not exists idx_todos_user_status_created on todos(user_id, status, created_at desc);
+create index if not exists idx_calendar_events_user_range on calendar_events(user_id, start_time, end_time);
+create index if not exists idx_reminders_user_sent_time on reminders(user_id, is_sent, remind_time);
 create index if not exists idx_reminders_remind_time on reminders(remind_time) where is_sent = false;
+
+-- Superseded by the composite indexes above (no-op on fresh databases)
+drop index if exists idx_todos_user_id;
+drop index if exists idx_calendar_events_user_id;
+drop index if exists idx_reminders_user_id;
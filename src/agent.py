@@ -6,6 +6,7 @@ Defines the CortanaAgent with dynamic system prompts, tool registration,
 and integration with the RotatingClient for resilient LLM access.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -17,13 +18,14 @@ from .cortana_agent import CortanaAgent
 from .tools import (
     add_todo, list_todos, complete_todo,
     add_calendar_event, check_calendar_availability,
-    search_long_term_memory, get_unread_emails,
+    search_long_term_memory, gather_context, get_unread_emails,
     add_reminder, list_reminders, cancel_reminder,
     fetch_url, search_web_exa, get_contents_exa,
-    execute_bash, read_file, write_file, edit_file
+    execute_bash, read_file, write_file, edit_file,
+    get_default_tz,
 )
 from .skills import load_all_skills, format_skills_for_prompt
-from .rotator_client import normalize_model_name, get_key_pool_status
+from .rotator_client import normalize_model_name, get_key_pool_status, invalidate_key_pool_cache
 
 logger = logging.getLogger(__name__)
 
@@ -72,18 +74,7 @@ async def dynamic_system_prompt(ctx: CortanaContext) -> str:
     user_info = ctx.deps.get("user_info", {})
     user_id = str(user_info.get('id', 'unknown'))
 
-    try:
-        from zoneinfo import ZoneInfo
-        tz = ZoneInfo(config.DEFAULT_TIMEZONE)
-    except Exception:
-        try:
-            import pytz
-            tz = pytz.timezone(config.DEFAULT_TIMEZONE)
-        except Exception:
-            from datetime import timezone
-            tz = timezone.utc
-
-    now = datetime.now(tz)
+    now = datetime.now(get_default_tz())
     current_time = now.isoformat()
     day_of_week = now.strftime('%A')
 
@@ -111,7 +102,9 @@ async def dynamic_system_prompt(ctx: CortanaContext) -> str:
         f"- **Timezone:** {config.DEFAULT_TIMEZONE}"
     )
 
-    skills_prompt = _get_skills_prompt(user_id)
+    # Skill loading stats (and on a cold cache, reads) files; keep it off the event loop
+    loop = asyncio.get_running_loop()
+    skills_prompt = await loop.run_in_executor(None, _get_skills_prompt, user_id)
 
     prompt = f"""
 {identity_content}
@@ -183,6 +176,7 @@ def _register_agent_tools(agent: CortanaAgent) -> None:
     agent.tool(add_calendar_event)
     agent.tool(check_calendar_availability)
     agent.tool(search_long_term_memory)
+    agent.tool(gather_context)
     agent.tool(get_unread_emails)
     agent.tool(add_reminder)
     agent.tool(list_reminders)
@@ -215,6 +209,7 @@ def update_agent_model(model_name: str) -> None:
 
     normalized = normalize_model_name(model_name)
     config.LLM_MODEL_NAME = normalized
+    invalidate_key_pool_cache()
 
     logger.info(f"Updating agent model to: {normalized}")
 
@@ -64,17 +64,18 @@ def _load_oauth_credentials() -> Dict[str, List[str]]:
     for key, value in os.environ.items():
         if not value:
             continue
-            
-        if "_OAUTH_CREDENTIALS" in key:
-            # Extract provider: "GEMINI_CLI_OAUTH_CREDENTIALS_1" -> "gemini_cli"
-            provider = key.split("_OAUTH_CREDENTIALS")[0].lower()
-            
-            if provider not in oauth_credentials:
-                oauth_credentials[provider] = []
-            
-            # Value can be a path or JSON string (for stateless deployment)
-            if value not in oauth_credentials[provider]:
-                oauth_credentials[provider].append(value)
+        
+        # Single search per key: "GEMINI_CLI_OAUTH_CREDENTIALS_1" -> ("GEMINI_CLI", marker, "_1")
+        prefix, marker, _ = key.partition("_OAUTH_CREDENTIALS")
+        if not marker:
+            continue
+        
+        provider = prefix.lower()
+        credentials = oauth_credentials.setdefault(provider, [])
+        
+        # Value can be a path or JSON string (for stateless deployment)
+        if value not in credentials:
+            credentials.append(value)
     
     return oauth_credentials
 
@@ -97,10 +98,22 @@ class Config:
     # Database Configuration
     SUPABASE_URL = os.getenv("SUPABASE_URL")
     SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+
+    # Supabase HTTP connection pool (shared across all PostgREST queries)
+    SUPABASE_HTTP_MAX_CONNECTIONS = int(os.getenv("SUPABASE_HTTP_MAX_CONNECTIONS", "20"))
+    SUPABASE_HTTP_MAX_KEEPALIVE = int(os.getenv("SUPABASE_HTTP_MAX_KEEPALIVE", "20"))
+    SUPABASE_HTTP_TIMEOUT = float(os.getenv("SUPABASE_HTTP_TIMEOUT", "30"))
+    SUPABASE_HTTP_CONNECT_TIMEOUT = float(os.getenv("SUPABASE_HTTP_CONNECT_TIMEOUT", "5"))
     
     # Memory Configuration
     ZEP_API_KEY = os.getenv("ZEP_API_KEY")
-    
+
+    # Zep HTTP connection pool (shared across all memory calls)
+    ZEP_HTTP_MAX_CONNECTIONS = int(os.getenv("ZEP_HTTP_MAX_CONNECTIONS", "100"))
+    ZEP_HTTP_MAX_KEEPALIVE = int(os.getenv("ZEP_HTTP_MAX_KEEPALIVE", "50"))
+    ZEP_HTTP_TIMEOUT = float(os.getenv("ZEP_HTTP_TIMEOUT", "30"))
+    ZEP_HTTP_CONNECT_TIMEOUT = float(os.getenv("ZEP_HTTP_CONNECT_TIMEOUT", "5"))
+
     # --- LLM Configuration (Legacy single-key mode) ---
     LLM_BASE_URL = os.getenv("LLM_BASE_URL", "https://api.openai.com/v1")
     LLM_API_KEY = os.getenv("LLM_API_KEY", os.getenv("OPENAI_API_KEY"))
@@ -140,6 +153,13 @@ class Config:
     # Access Control
     MASTER_USER_ID = os.getenv("MASTER_USER_ID")
     
+    # Reminder polling: interval after a hit, backing off to the max while idle (seconds)
+    REMINDER_POLL_BASE_INTERVAL = float(os.getenv("REMINDER_POLL_BASE_INTERVAL", "5"))
+    REMINDER_POLL_MAX_INTERVAL = float(os.getenv("REMINDER_POLL_MAX_INTERVAL", "300"))
+    
+    # Maximum number of agent runs processed concurrently
+    AGENT_MAX_CONCURRENT_RUNS = int(os.getenv("AGENT_MAX_CONCURRENT_RUNS", "16"))
+    
     # --- Coding Agent Configuration ---
     # Ported from badlogic/pi-mono mom package
     
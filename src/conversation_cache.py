@@ -293,8 +293,10 @@ class ConversationCache:
     
     def _sync_save(self, path: Path, data: Dict[str, Any]) -> None:
         """Synchronous save for executor."""
+        # Compact separators: these files are rewritten on every message and are
+        # never hand-edited, so skip the (much slower) pretty-printing path
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
 
     async def _save_to_file(self, state: ConversationState) -> None:
         """Save conversation state to file."""
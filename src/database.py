@@ -1,13 +1,33 @@
-from supabase import create_client, Client
+import asyncio
+from typing import Any
+
+import httpx
+from supabase import create_client, Client, ClientOptions
 from .config import config
 
+# Shared HTTP client for Supabase: one keep-alive pool sized for the executor
+# threads running queries, with HTTP/2 so concurrent tool calls multiplex over
+# a single TLS connection
+database_http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=config.SUPABASE_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=config.SUPABASE_HTTP_MAX_KEEPALIVE,
+    ),
+    timeout=httpx.Timeout(config.SUPABASE_HTTP_TIMEOUT, connect=config.SUPABASE_HTTP_CONNECT_TIMEOUT),
+)
+
 class Database:
     _instance = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(Database, cls).__new__(cls)
-            cls._instance.client: Client = create_client(config.SUPABASE_URL, config.SUPABASE_KEY)
+            cls._instance.client: Client = create_client(
+                config.SUPABASE_URL,
+                config.SUPABASE_KEY,
+                options=ClientOptions(httpx_client=database_http_client),
+            )
         return cls._instance
 
     def get_client(self) -> Client:
@@ -15,3 +35,26 @@ class Database:
 
 # Global instance
 db = Database().get_client()
+
+
+async def run_query(query: Any) -> Any:
+    """
+    Execute a PostgREST query builder without blocking the event loop.
+
+    The supabase client is synchronous, so ``execute()`` runs in the default
+    executor; concurrent tool calls then overlap their round trips instead of
+    serializing the whole bot behind each HTTP request.
+
+    Args:
+        query: A built query (e.g. ``db.table("todos").select("id").eq(...)``).
+
+    Returns:
+        The APIResponse returned by ``query.execute()``.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, query.execute)
+
+
+def close_database_client() -> None:
+    """Close the shared Supabase HTTP client and release pooled connections."""
+    database_http_client.close()
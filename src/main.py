@@ -8,12 +8,19 @@ and slash command registration.
 
 import discord
 from discord import app_commands
+from zep_cloud.types import Message
 import asyncio
+import atexit
 import logging
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 
 from .config import config
 from . import agent
-from .memory import memory_client
+from .memory import memory_client, close_memory_client
+from .database import close_database_client
+from .tools import close_http_session
 from .scheduler import ReminderScheduler
 from .conversation_cache import get_conversation_cache
 from .rotator_client import (
@@ -28,6 +35,23 @@ from .rotator_client import (
 
 logger = logging.getLogger(__name__)
 
+# Discord message size limit and the chunk size used when splitting long replies
+_DISCORD_MESSAGE_LIMIT = 2000
+_RESPONSE_CHUNK_SIZE = 1990
+
+# Reply templates shared by the command and message handlers
+DM_ONLY_MSG = "❌ This command can only be used in DM."
+UNAUTHORIZED_MSG = "❌ You are not authorized to use this command."
+COMMAND_FAILED_TMPL = "❌ Failed to {}: {}"
+AGENT_ERROR_MSG = "I encountered a critical error processing your request. Please check the logs."
+
+
+@lru_cache(maxsize=4096)
+def _ids_for(author_id: int) -> tuple[str, str]:
+    """Return the (user_id, thread_id) strings used for Zep and the conversation cache."""
+    user_id = str(author_id)
+    return user_id, f"discord_{user_id}"
+
 
 class SettingsGroup(app_commands.Group):
     """Slash command group for Cortana settings."""
@@ -42,13 +66,13 @@ class SettingsGroup(app_commands.Group):
         """
         # Only allow DM channels (prohibit all channel interactions)
         if not isinstance(interaction.channel, discord.DMChannel):
-            await interaction.response.send_message("❌ This command can only be used in DM.", ephemeral=True)
+            await interaction.response.send_message(DM_ONLY_MSG, ephemeral=True)
             return False
         
         # Only allow master user (MASTER_USER_ID is guaranteed to be set by config.validate())
         assert config.MASTER_USER_ID is not None, "MASTER_USER_ID must be set"
         if interaction.user.id != int(config.MASTER_USER_ID):
-            await interaction.response.send_message("❌ You are not authorized to use this command.", ephemeral=True)
+            await interaction.response.send_message(UNAUTHORIZED_MSG, ephemeral=True)
             return False
         
         return True
@@ -73,7 +97,7 @@ class SettingsGroup(app_commands.Group):
             logger.info(f"Model updated to {normalized} by {interaction.user}")
         except Exception as e:
             logger.error(f"Failed to update model: {e}")
-            await interaction.response.send_message(f"❌ Failed to update model: {e}", ephemeral=True)
+            await interaction.response.send_message(COMMAND_FAILED_TMPL.format("update model", e), ephemeral=True)
 
     @app_commands.command(name="status", description="Show current model and API key pool status")
     async def status(self, interaction: discord.Interaction):
@@ -119,7 +143,7 @@ class SettingsGroup(app_commands.Group):
             
         except Exception as e:
             logger.error(f"Failed to get status: {e}")
-            await interaction.response.send_message(f"❌ Failed to get status: {e}", ephemeral=True)
+            await interaction.response.send_message(COMMAND_FAILED_TMPL.format("get status", e), ephemeral=True)
 
     @app_commands.command(name="models", description="List available models for a provider")
     @app_commands.describe(provider="Provider name (e.g. openai, gemini, anthropic)")
@@ -173,7 +197,7 @@ class SettingsGroup(app_commands.Group):
             
         except Exception as e:
             logger.error(f"Failed to list models: {e}")
-            await interaction.followup.send(f"❌ Failed to list models: {e}")
+            await interaction.followup.send(COMMAND_FAILED_TMPL.format("list models", e))
 
     @app_commands.command(name="usage", description="Show API key usage statistics")
     async def usage(self, interaction: discord.Interaction):
@@ -183,7 +207,8 @@ class SettingsGroup(app_commands.Group):
             return
         
         try:
-            usage = get_usage_summary()
+            loop = asyncio.get_running_loop()
+            usage = await loop.run_in_executor(None, get_usage_summary)
             
             embed = discord.Embed(
                 title="📊 API Key Usage Statistics",
@@ -247,7 +272,7 @@ class SettingsGroup(app_commands.Group):
             
         except Exception as e:
             logger.error(f"Failed to get usage: {e}")
-            await interaction.response.send_message(f"❌ Failed to get usage: {e}", ephemeral=True)
+            await interaction.response.send_message(COMMAND_FAILED_TMPL.format("get usage", e), ephemeral=True)
 
 
 class CortanaClient(discord.Client):
@@ -257,6 +282,18 @@ class CortanaClient(discord.Client):
         super().__init__(*args, **kwargs)
         self.scheduler = None
         self.tree = app_commands.CommandTree(self)
+        
+        # MASTER_USER_ID is guaranteed to be set by config.validate()
+        assert config.MASTER_USER_ID is not None, "MASTER_USER_ID must be set"
+        self._master_user_id = int(config.MASTER_USER_ID)
+        
+        # Bound concurrent agent runs so bursts don't pile up LLM calls and frames
+        self._agent_sem = asyncio.Semaphore(config.AGENT_MAX_CONCURRENT_RUNS)
+        
+        # Zep threads (and their users) known to exist
+        self._zep_threads_ready: set[str] = set()
+        # In-flight bootstraps, keyed by thread id
+        self._zep_bootstrap_tasks: dict[str, asyncio.Task] = {}
     
     async def setup_hook(self):
         """Called when the client is setting up."""
@@ -273,6 +310,12 @@ class CortanaClient(discord.Client):
                 logger.info("Running in legacy single-key mode")
         except Exception as e:
             logger.warning(f"RotatingClient initialization skipped: {e}")
+        
+        # Start the reminder scheduler (setup_hook runs once, unlike on_ready
+        # which fires again on every reconnect)
+        self.scheduler = ReminderScheduler(self)
+        self.scheduler.start()
+        logger.info('Reminder scheduler initialized')
 
     async def on_ready(self):
         """Called when the bot is ready."""
@@ -283,81 +326,120 @@ class CortanaClient(discord.Client):
         status = await get_key_pool_status()
         if status.get("providers"):
             logger.info(f"API Key Pool: {status['providers']} with {status['key_counts']}")
-        
-        # Start the reminder scheduler
-        if self.scheduler is None:
-            self.scheduler = ReminderScheduler(self)
-            self.scheduler.start()
-            logger.info('Reminder scheduler initialized')
 
     async def close(self):
         """Clean up resources on shutdown."""
         logger.info("Shutting down Cortana...")
         
+        # Stop the reminder scheduler
+        if self.scheduler is not None:
+            self.scheduler.stop()
+        
         # Close the rotating client
         await close_rotating_client()
         
+        # Release pooled Zep, Supabase and tool HTTP connections
+        await close_memory_client()
+        close_database_client()
+        await close_http_session()
+        
         # Call parent close
         await super().close()
 
-    async def on_message(self, message):
-        """Handle incoming messages."""
-        # Don't reply to self
-        if message.author.id == self.user.id:
-            return
-
-        # Access Control: Only allow DM channels (prohibit all channel interactions)
-        if not isinstance(message.channel, discord.DMChannel):
-            logger.debug(f"Ignoring message from non-DM channel: {message.channel.name} ({message.channel.type})")
-            return
-
-        # Access Control: Only allow master user (MASTER_USER_ID is guaranteed to be set by config.validate())
-        assert config.MASTER_USER_ID is not None, "MASTER_USER_ID must be set"
-        if message.author.id != int(config.MASTER_USER_ID):
-            logger.debug(f"Ignoring message from non-master user: {message.author.id}")
+    async def _ensure_zep_session(self, user_id: str, thread_id: str, display_name: str) -> None:
+        """
+        Ensure the Zep user and thread exist, creating whichever is missing.
+        
+        Threads confirmed to exist are remembered for the lifetime of the
+        process, so the existence checks only hit Zep on the first message.
+        Concurrent callers for the same thread share a single bootstrap.
+        """
+        if thread_id in self._zep_threads_ready:
             return
-
-        logger.debug(f"Message from {message.author}: {message.content[:100]}...")
-
-        # 1. Retrieve Context from Zep
-        user_id = str(message.author.id)
-        thread_id = f"discord_{user_id}"
         
-        # Ensure user exists in Zep
-        try:
-            await memory_client.user.get(user_id=user_id)
-        except Exception:
+        task = self._zep_bootstrap_tasks.get(thread_id)
+        if task is None:
+            task = asyncio.create_task(self._bootstrap_zep_session(user_id, thread_id, display_name))
+            self._zep_bootstrap_tasks[thread_id] = task
+            task.add_done_callback(lambda _: self._zep_bootstrap_tasks.pop(thread_id, None))
+        
+        # Shield so one cancelled waiter doesn't abort the bootstrap for the others
+        await asyncio.shield(task)
+    
+    async def _bootstrap_zep_session(self, user_id: str, thread_id: str, display_name: str) -> None:
+        """Look up the Zep user and thread, creating whichever is missing."""
+        user_res, thread_res = await asyncio.gather(
+            memory_client.user.get(user_id=user_id),
+            memory_client.thread.get(thread_id=thread_id),
+            return_exceptions=True,
+        )
+        ready = True
+        
+        if isinstance(user_res, Exception):
             # User doesn't exist, create it
             try:
                 await memory_client.user.add(
                     user_id=user_id,
-                    first_name=message.author.display_name,
-                    metadata={"discord_id": str(message.author.id)}
+                    first_name=display_name,
+                    metadata={"discord_id": user_id}
                 )
             except Exception as user_err:
                 logger.warning(f"User creation error: {user_err}")
+                ready = False
         
-        # Ensure thread exists
-        try:
-            await memory_client.thread.get(thread_id=thread_id)
-        except Exception:
-            # Thread doesn't exist, create it
+        if isinstance(thread_res, Exception):
+            # Thread doesn't exist, create it (after the user, which it references)
             try:
                 await memory_client.thread.create(thread_id=thread_id, user_id=user_id)
             except Exception as create_err:
                 logger.warning(f"Thread creation error: {create_err}")
+                ready = False
         
-        zep_context = "No previous context."
+        if ready:
+            self._zep_threads_ready.add(thread_id)
+
+    async def _get_zep_context(self, thread_id: str) -> str:
+        """Get the user's Zep memory context for a thread."""
         try:
-            # Get user context (memory)
             memory = await memory_client.thread.get_user_context(thread_id=thread_id)
-            zep_context = memory.context if memory and memory.context else "No previous context."
+            return memory.context if memory and memory.context else "No previous context."
         except Exception as e:
             logger.warning(f"Zep memory retrieval error: {e}")
+            return "No previous context."
+
+    async def on_message(self, message):
+        """Handle incoming messages."""
+        author_id = message.author.id
+
+        # Don't reply to self
+        if author_id == self.user.id:
+            return
+
+        # Access Control: Only allow master user. Checked before the channel type
+        # since it is a plain int comparison and rejects most ambient traffic.
+        if author_id != self._master_user_id:
+            logger.debug(f"Ignoring message from non-master user: {author_id}")
+            return
 
-        # 2. Get conversation history from cache
+        # Access Control: Only allow DM channels (prohibit all channel interactions)
+        if not isinstance(message.channel, discord.DMChannel):
+            logger.debug(f"Ignoring message from non-DM channel: {message.channel.name} ({message.channel.type})")
+            return
+
+        logger.debug(f"Message from {message.author}: {message.content[:100]}...")
+
+        # 1. Retrieve Context from Zep
+        user_id, thread_id = _ids_for(author_id)
+        
+        # Ensure user and thread exist in Zep (both lookups run concurrently)
+        await self._ensure_zep_session(user_id, thread_id, message.author.display_name)
+        
+        # 2. Fetch Zep memory and cached conversation history concurrently
         conv_cache = get_conversation_cache()
-        history = await conv_cache.get_history(user_id, model=config.LLM_MODEL_NAME)
+        zep_context, history = await asyncio.gather(
+            self._get_zep_context(thread_id),
+            conv_cache.get_history(user_id, model=config.LLM_MODEL_NAME),
+        )
         
         # 3. Run Agent
         user_info = {
@@ -368,24 +450,25 @@ class CortanaClient(discord.Client):
         
         deps = {
             "user_info": user_info,
-            "zep_memory_context": zep_context
+            "zep_memory_context": zep_context,
+            "reminder_scheduler": self.scheduler,
         }
 
         try:
             async with message.channel.typing():
-                result = await agent.cortana_agent.run(
-                    message.content, 
-                    deps=deps,
-                    history=history if history else None
-                )
+                async with self._agent_sem:
+                    result = await agent.cortana_agent.run(
+                        message.content, 
+                        deps=deps,
+                        history=history if history else None
+                    )
                 response_text = result.output
                 
                 # 4. Send Response (handle long messages)
-                if len(response_text) > 2000:
+                if len(response_text) > _DISCORD_MESSAGE_LIMIT:
                     # Split into chunks
-                    chunks = [response_text[i:i+1990] for i in range(0, len(response_text), 1990)]
-                    for chunk in chunks:
-                        await message.channel.send(chunk)
+                    for i in range(0, len(response_text), _RESPONSE_CHUNK_SIZE):
+                        await message.channel.send(response_text[i:i + _RESPONSE_CHUNK_SIZE])
                 else:
                     await message.channel.send(response_text)
                 
@@ -394,8 +477,6 @@ class CortanaClient(discord.Client):
                 await conv_cache.add_message(user_id, "assistant", response_text, model=config.LLM_MODEL_NAME)
                 
                 # 6. Save Both Messages to Zep (long-term memory)
-                from zep_cloud.types import Message
-                
                 try:
                     await memory_client.thread.add_messages(
                         thread_id=thread_id,
@@ -409,16 +490,34 @@ class CortanaClient(discord.Client):
 
         except Exception as e:
             logger.error(f"Agent Error: {e}", exc_info=True)
-            await message.channel.send("I encountered a critical error processing your request. Please check the logs.")
+            await message.channel.send(AGENT_ERROR_MSG)
+
+
+def _configure_logging() -> None:
+    """
+    Configure root logging to go through a QueueHandler.
+    
+    Records are enqueued from the event loop without blocking on stdio; a
+    QueueListener thread formats and writes them to stderr.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, config.LOG_LEVEL.upper(), logging.INFO))
+    root.handlers[:] = [QueueHandler(log_queue)]
+    
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def main():
     """Main entry point for the Cortana bot."""
     # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, config.LOG_LEVEL.upper(), logging.INFO),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    _configure_logging()
     
     try:
         config.validate()
@@ -434,7 +533,9 @@ def main():
     intents.message_content = True
     
     client = CortanaClient(intents=intents)
-    client.run(config.DISCORD_TOKEN)
+    # Logging is already routed through the queue listener; don't let discord.py
+    # install its own (blocking) stream handler on the root logger
+    client.run(config.DISCORD_TOKEN, log_handler=None)
 
 
 if __name__ == "__main__":
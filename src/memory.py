@@ -1,5 +1,22 @@
+import httpx
 from zep_cloud.client import AsyncZep
 from .config import config
 
+# Shared HTTP client for Zep: pooled keep-alive connections and HTTP/2 so the
+# per-message user/thread/context calls multiplex over a single TLS connection
+memory_http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=config.ZEP_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=config.ZEP_HTTP_MAX_KEEPALIVE,
+    ),
+    timeout=httpx.Timeout(config.ZEP_HTTP_TIMEOUT, connect=config.ZEP_HTTP_CONNECT_TIMEOUT),
+)
+
 # Global Zep client instance
-memory_client = AsyncZep(api_key=config.ZEP_API_KEY)
+memory_client = AsyncZep(api_key=config.ZEP_API_KEY, httpx_client=memory_http_client)
+
+
+async def close_memory_client():
+    """Close the shared Zep HTTP client and release pooled connections."""
+    await memory_http_client.aclose()
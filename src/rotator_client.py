@@ -22,9 +22,12 @@ Usage:
 """
 
 import asyncio
+import copy
+import functools
 import json
 import logging
 import os
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
@@ -35,7 +38,11 @@ logger = logging.getLogger(__name__)
 # Global client instance
 _rotating_client: Optional[Any] = None
 _client_lock = asyncio.Lock()
-_initialization_attempted = False
+
+# Monotonic time of the last initialization attempt; a failed attempt is
+# retried once _INIT_RETRY_SECONDS have passed
+_last_init_attempt_ts: Optional[float] = None
+_INIT_RETRY_SECONDS = 60
 
 
 async def get_rotating_client():
@@ -43,9 +50,10 @@ async def get_rotating_client():
     Get or create the RotatingClient singleton.
     
     Returns the client instance, or None if rotator is disabled or unavailable.
+    A failed initialization is retried after _INIT_RETRY_SECONDS.
     Thread-safe via asyncio lock.
     """
-    global _rotating_client, _initialization_attempted
+    global _rotating_client, _last_init_attempt_ts
     
     if not config.ENABLE_ROTATOR:
         logger.debug("Rotator is disabled via ENABLE_ROTATOR=false")
@@ -59,11 +67,12 @@ async def get_rotating_client():
         if _rotating_client is not None:
             return _rotating_client
         
-        if _initialization_attempted:
-            # Already tried and failed, don't retry
+        now = time.monotonic()
+        if _last_init_attempt_ts is not None and now - _last_init_attempt_ts < _INIT_RETRY_SECONDS:
+            # Failed recently, don't retry yet
             return None
         
-        _initialization_attempted = True
+        _last_init_attempt_ts = now
         
         try:
             from rotator_library import RotatingClient
@@ -96,6 +105,8 @@ async def get_rotating_client():
             )
             
             logger.info("RotatingClient initialized successfully")
+            # Counts memoized before the rotator existed came from litellm
+            _token_count_cached.cache_clear()
             return _rotating_client
             
         except ImportError as e:
@@ -106,9 +117,16 @@ async def get_rotating_client():
             return None
 
 
+def _fast_get_client():
+    """Return the already-initialized RotatingClient without awaiting, or None."""
+    if config.ENABLE_ROTATOR:
+        return _rotating_client
+    return None
+
+
 async def close_rotating_client():
     """Close the rotating client and release resources."""
-    global _rotating_client, _initialization_attempted
+    global _rotating_client, _last_init_attempt_ts
     
     async with _client_lock:
         if _rotating_client is not None:
@@ -119,7 +137,7 @@ async def close_rotating_client():
                 logger.warning(f"Error closing RotatingClient: {e}")
             finally:
                 _rotating_client = None
-                _initialization_attempted = False
+                _last_init_attempt_ts = None
 
 
 def normalize_model_name(model: str, prefer_oauth: bool = False) -> str:
@@ -150,35 +168,38 @@ def normalize_model_name(model: str, prefer_oauth: bool = False) -> str:
         prefer_oauth: If True and no provider specified, prefer OAuth provider
                       (e.g., gemini_cli over gemini for Gemini models).
     """
+    return _normalize_impl(model, prefer_oauth)
+
+
+# Model-name prefix -> provider, checked in order. Gemini and Qwen have an
+# OAuth variant (second entry) selected by prefer_oauth.
+_MODEL_PREFIX_PROVIDERS = (
+    (("gpt-", "o1", "o3"), "openai", "openai"),
+    (("gemini",), "gemini", "gemini_cli"),
+    (("claude",), "anthropic", "anthropic"),
+    (("qwen",), "qwen", "qwen_code"),
+    (("deepseek",), "deepseek", "deepseek"),
+    (("llama", "meta"), "meta", "meta"),
+    (("groq",), "groq", "groq"),
+    (("mistral",), "mistral", "mistral"),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_impl(model: str, prefer_oauth: bool) -> str:
+    """Memoized body of normalize_model_name (the set of model names is small)."""
     if "/" in model:
         return model
     
     model_lower = model.lower()
     
-    # Detect provider from model name
-    if model_lower.startswith("gpt-") or model_lower.startswith("o1") or model_lower.startswith("o3"):
-        return f"openai/{model}"
-    elif model_lower.startswith("gemini"):
-        # Use gemini_cli for OAuth, gemini for API key
-        provider = "gemini_cli" if prefer_oauth else "gemini"
-        return f"{provider}/{model}"
-    elif model_lower.startswith("claude"):
-        return f"anthropic/{model}"
-    elif model_lower.startswith("qwen"):
-        # Use qwen_code for OAuth, qwen for API key
-        provider = "qwen_code" if prefer_oauth else "qwen"
-        return f"{provider}/{model}"
-    elif model_lower.startswith("deepseek"):
-        return f"deepseek/{model}"
-    elif model_lower.startswith("llama") or model_lower.startswith("meta"):
-        return f"meta/{model}"
-    elif model_lower.startswith("groq"):
-        return f"groq/{model}"
-    elif model_lower.startswith("mistral"):
-        return f"mistral/{model}"
-    else:
-        # Default to openai for unknown models
-        return f"openai/{model}"
+    for prefixes, api_provider, oauth_provider in _MODEL_PREFIX_PROVIDERS:
+        if model_lower.startswith(prefixes):
+            provider = oauth_provider if prefer_oauth else api_provider
+            return f"{provider}/{model}"
+    
+    # Default to openai for unknown models
+    return f"openai/{model}"
 
 
 # Valid OAuth provider prefixes
@@ -228,11 +249,14 @@ async def rotating_completion(
     if model is None:
         model = config.LLM_MODEL_NAME
     
-    # Normalize model name
-    model = normalize_model_name(model)
+    # Normalize model name (most callers already pass provider/model)
+    if "/" not in model:
+        model = normalize_model_name(model)
     
-    # Try to get rotating client
-    client = await get_rotating_client()
+    # Try to get rotating client, skipping the lock once it's initialized
+    client = _fast_get_client()
+    if client is None:
+        client = await get_rotating_client()
     
     if client is not None:
         # Use rotating client
@@ -393,14 +417,21 @@ async def _anthropic_fallback(request: Any) -> dict:
     if system:
         openai_messages.append({"role": "system", "content": system})
     
-    for msg in messages:
-        if isinstance(msg, dict):
-            openai_messages.append(msg)
-        else:
-            # Handle Anthropic message objects
-            role = getattr(msg, 'role', 'user')
-            content = getattr(msg, 'content', '')
-            openai_messages.append({"role": role, "content": content})
+    if all(isinstance(msg, dict) for msg in messages):
+        # Common case: plain JSON messages need no translation
+        openai_messages.extend(messages)
+    else:
+        for msg in messages:
+            if isinstance(msg, dict):
+                openai_messages.append(msg)
+            elif hasattr(msg, 'model_dump'):
+                # Pydantic message models dump both fields in one call
+                openai_messages.append(msg.model_dump(include={'role', 'content'}))
+            else:
+                # Handle other Anthropic message objects
+                role = getattr(msg, 'role', 'user')
+                content = getattr(msg, 'content', '')
+                openai_messages.append({"role": role, "content": content})
     
     # Make request
     response = await rotating_completion(
@@ -455,26 +486,49 @@ async def get_available_models(provider: Optional[str] = None) -> Union[Dict[str
         return await client.get_all_available_models(grouped=True)
 
 
+# Short-lived snapshot of get_key_pool_status, so polling it doesn't rescan
+# the environment for keys on every call
+_pool_status_cache: Optional[Dict[str, Any]] = None
+_pool_cache_ts = 0.0
+_POOL_TTL = 5.0
+
+
+def invalidate_key_pool_cache() -> None:
+    """Drop the cached key pool status (call after changing keys or the model)."""
+    global _pool_status_cache
+    _pool_status_cache = None
+
+
 async def get_key_pool_status() -> Dict[str, Any]:
     """
     Get the current status of the API key pool.
     
+    The result is cached for _POOL_TTL seconds.
+    
     Returns dict with:
         - providers: list of provider names
         - key_counts: dict of {provider: count}
         - rotator_enabled: bool
     """
+    global _pool_status_cache, _pool_cache_ts
+    
+    now = time.monotonic()
+    if _pool_status_cache is not None and now - _pool_cache_ts < _POOL_TTL:
+        return copy.deepcopy(_pool_status_cache)
+    
     config.load_rotator_keys()
     
     providers = config.get_available_providers()
     key_counts = {p: config.get_key_count(p) for p in providers}
     
-    return {
+    _pool_status_cache = {
         "providers": providers,
         "key_counts": key_counts,
         "rotator_enabled": config.ENABLE_ROTATOR,
         "current_model": config.LLM_MODEL_NAME,
     }
+    _pool_cache_ts = now
+    return copy.deepcopy(_pool_status_cache)
 
 
 # =============================================================================
@@ -486,24 +540,52 @@ def get_usage_file_path() -> str:
     return config.ROTATOR_USAGE_FILE_PATH
 
 
+# Parsed usage file and its derived summary, keyed on (path, mtime_ns, size)
+# so an unchanged file is neither re-read nor re-aggregated
+_usage_cache: Dict[str, Any] = {"key": None, "data": {}, "summary": None}
+
+
+def _usage_file_key(usage_path: str) -> Optional[tuple]:
+    """Return a (path, mtime_ns, size) fingerprint, or None if the file is missing."""
+    try:
+        st = os.stat(usage_path)
+    except OSError:
+        return None
+    return (usage_path, st.st_mtime_ns, st.st_size)
+
+
 def load_usage_stats() -> Dict[str, Any]:
     """
     Load usage statistics from the JSON file.
     
+    The parsed data is cached until the file's mtime or size changes; callers
+    get their own copy, so modifying the result never touches the cache.
+    
     Returns:
         Dict containing usage data, or empty dict if file doesn't exist
     """
+    return copy.deepcopy(_load_usage_stats_cached())
+
+
+def _load_usage_stats_cached() -> Dict[str, Any]:
+    """Load usage statistics, returning the shared cached dict (read-only)."""
     usage_path = get_usage_file_path()
+    key = _usage_file_key(usage_path)
     
-    if not os.path.exists(usage_path):
+    if key is None:
         return {}
+    if key == _usage_cache["key"]:
+        return _usage_cache["data"]
     
     try:
         with open(usage_path, 'r') as f:
-            return json.load(f)
+            data = json.load(f)
     except (json.JSONDecodeError, IOError) as e:
         logger.warning(f"Failed to load usage stats: {e}")
         return {}
+    
+    _usage_cache.update(key=key, data=data, summary=None)
+    return data
 
 
 def get_usage_summary() -> Dict[str, Any]:
@@ -518,7 +600,12 @@ def get_usage_summary() -> Dict[str, Any]:
         - by_model: dict of model stats
         - last_updated: timestamp
     """
-    stats = load_usage_stats()
+    usage_path = get_usage_file_path()
+    key = _usage_file_key(usage_path)
+    if key is not None and key == _usage_cache["key"] and _usage_cache["summary"] is not None:
+        return copy.deepcopy(_usage_cache["summary"])
+    
+    stats = _load_usage_stats_cached()
     
     if not stats:
         return {
@@ -528,7 +615,7 @@ def get_usage_summary() -> Dict[str, Any]:
             "by_provider": {},
             "by_model": {},
             "last_updated": None,
-            "file_path": get_usage_file_path(),
+            "file_path": usage_path,
         }
     
     # Aggregate stats
@@ -570,17 +657,12 @@ def get_usage_summary() -> Dict[str, Any]:
                     by_model[model] = 0
                 by_model[model] += model_data.get("requests", 0)
     
-    # Get file modification time
-    usage_path = get_usage_file_path()
+    # File modification time, from the fingerprint taken above
     last_updated = None
-    if os.path.exists(usage_path):
-        try:
-            mtime = os.path.getmtime(usage_path)
-            last_updated = datetime.fromtimestamp(mtime).isoformat()
-        except OSError:
-            pass
+    if key is not None:
+        last_updated = datetime.fromtimestamp(key[1] / 1e9).isoformat()
     
-    return {
+    summary = {
         "total_requests": total_requests,
         "total_tokens": total_tokens,
         "total_cost": round(total_cost, 4),
@@ -589,6 +671,10 @@ def get_usage_summary() -> Dict[str, Any]:
         "last_updated": last_updated,
         "file_path": usage_path,
     }
+    
+    if key is not None and key == _usage_cache["key"]:
+        _usage_cache["summary"] = summary
+    return copy.deepcopy(summary)
 
 
 async def get_detailed_usage() -> Dict[str, Any]:
@@ -597,7 +683,8 @@ async def get_detailed_usage() -> Dict[str, Any]:
     
     Returns comprehensive usage data for monitoring.
     """
-    summary = get_usage_summary()
+    loop = asyncio.get_running_loop()
+    summary = await loop.run_in_executor(None, get_usage_summary)
     pool_status = await get_key_pool_status()
     
     return {
@@ -610,12 +697,83 @@ async def get_detailed_usage() -> Dict[str, Any]:
 # Token Counting
 # =============================================================================
 
+# Inputs longer than this (in characters) are counted without memoization,
+# to bound the memory held by the token count cache
+_TOKEN_CACHE_MAX_CHARS = 32 * 1024
+
+
+class _TokenizerUnavailable(Exception):
+    """Raised inside the token-count cache so estimates are not memoized."""
+
+
 def token_count(model: str, text: str = None, messages: List[Dict[str, str]] = None) -> int:
     """
     Count tokens for text or messages using the rotating client.
     
     This is a synchronous operation as token counting doesn't require API calls.
+    Counts for repeated inputs (e.g. the same system prompt each turn) are
+    memoized; large inputs and messages with extra fields bypass the cache.
+    """
+    count = None
+    try:
+        if messages:
+            key = _messages_cache_key(messages)
+            if key is not None:
+                return _token_count_cached(model, None, key)
+        elif text is not None and len(text) <= _TOKEN_CACHE_MAX_CHARS:
+            return _token_count_cached(model, text, None)
+        
+        count = _token_count_impl(model, text, messages)
+    except _TokenizerUnavailable:
+        pass
+    
+    if count is None:
+        # Rough estimate as last resort (never memoized, so a tokenizer that
+        # becomes available later is used on the next call)
+        if text:
+            return len(text) // 4
+        elif messages:
+            return sum(len(m.get("content") or "") for m in messages if isinstance(m, dict)) // 4
+        return 0
+    return count
+
+
+def _messages_cache_key(messages: List[Dict[str, str]]) -> Optional[tuple]:
+    """
+    Build a hashable ((role, content), ...) key for plain chat messages.
+    
+    Returns None unless every message has exactly a string role and string
+    content (so tool calls, multimodal parts and role-less messages are never
+    cached), or when the total content is too large to cache.
     """
+    key = []
+    total = 0
+    for m in messages:
+        if not isinstance(m, dict) or set(m) != {"role", "content"}:
+            return None
+        role = m["role"]
+        content = m["content"]
+        if not isinstance(role, str) or not isinstance(content, str):
+            return None
+        total += len(content)
+        if total > _TOKEN_CACHE_MAX_CHARS:
+            return None
+        key.append((role, content))
+    return tuple(key)
+
+
+@functools.lru_cache(maxsize=4096)
+def _token_count_cached(model: str, text: Optional[str], messages_key: Optional[tuple]) -> int:
+    """Memoized token_count for hashable inputs (raises rather than caching an estimate)."""
+    messages = [{"role": role, "content": content} for role, content in messages_key] if messages_key else None
+    count = _token_count_impl(model, text, messages)
+    if count is None:
+        raise _TokenizerUnavailable()
+    return count
+
+
+def _token_count_impl(model: str, text: Optional[str], messages: Optional[List[Dict[str, str]]]) -> Optional[int]:
+    """Count tokens via the rotator, then litellm; None if neither tokenizer works."""
     try:
         # Try to use rotator's token counter if available
         if _rotating_client is not None:
@@ -637,9 +795,4 @@ def token_count(model: str, text: str = None, messages: List[Dict[str, str]] = N
     except Exception:
         pass
     
-    # Rough estimate as last resort
-    if text:
-        return len(text) // 4
-    elif messages:
-        return sum(len(m.get("content", "")) for m in messages) // 4
-    return 0
+    return None
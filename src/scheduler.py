@@ -1,15 +1,22 @@
 import asyncio
+import logging
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
-from .database import db
+from typing import Dict, List, Optional
+
+import discord
+
+from .database import db, run_query
 from .config import config
 
-if TYPE_CHECKING:
-    import discord
+logger = logging.getLogger(__name__)
 
 class ReminderScheduler:
     """Background service that checks and sends reminders to users via Discord DM."""
     
+    # Idle backoff: base interval doubles per empty poll, up to the configured max
+    BACKOFF_FACTOR = 2
+    MAX_BACKOFF_STEPS = 16
+    
     def __init__(self, discord_client: 'discord.Client'):
         """
         Initialize the reminder scheduler.
@@ -20,50 +27,133 @@ class ReminderScheduler:
         self.client = discord_client
         self.running = False
         self.task = None
+        # Set by notify() to cut the current sleep short
+        self._wake = asyncio.Event()
+        # Discord users resolved for earlier reminders, by user ID
+        self._user_cache: Dict[int, 'discord.User'] = {}
     
-    async def check_and_send_reminders(self):
-        """Check for due reminders and send them to users."""
+    async def check_and_send_reminders(self) -> int:
+        """
+        Check for due reminders and send them to users.
+        
+        Returns:
+            Number of reminders delivered and marked as sent. Reminders that
+            failed and will be retried are not counted, so a reminder that
+            keeps failing does not hold the loop at its fastest interval.
+        """
         try:
             # Get current time in UTC
             now = datetime.now(timezone.utc)
             
-            # Query for reminders that are due and not yet sent
-            response = db.table("reminders").select("*") \
-                .lte("remind_time", now.isoformat()) \
-                .eq("is_sent", False) \
-                .execute()
+            # Query for reminders that are due and not yet sent, fetching only
+            # what send_reminder uses (served by the partial index
+            # idx_reminders_remind_time ... where is_sent = false)
+            response = await run_query(
+                db.table("reminders").select("id,user_id,message")
+                .lte("remind_time", now.isoformat())
+                .eq("is_sent", False)
+            )
             
             if not response.data:
-                return
+                return 0
             
-            print(f"Found {len(response.data)} reminder(s) to send")
+            logger.info(f"Found {len(response.data)} reminder(s) to send")
             
+            # Group by user so each user is looked up once
+            by_user: Dict[int, List[dict]] = {}
             for reminder in response.data:
-                await self.send_reminder(reminder)
+                by_user.setdefault(reminder['user_id'], []).append(reminder)
+            
+            # Send to users concurrently, then mark the whole batch with a single UPDATE
+            results = await asyncio.gather(
+                *(self._send_user_reminders(reminders) for reminders in by_user.values())
+            )
+            done_ids = [
+                reminder_id
+                for user_results in results
+                for reminder_id, mark_sent in user_results
+                if mark_sent
+            ]
+            
+            if done_ids:
+                await run_query(db.table("reminders").update({"is_sent": True}).in_("id", done_ids))
+            
+            return len(done_ids)
         
         except Exception as e:
-            print(f"Error checking reminders: {e}")
+            logger.error(f"Error checking reminders: {e}")
+            return 0
     
-    async def send_reminder(self, reminder: dict):
+    async def seconds_until_next_reminder(self) -> Optional[float]:
+        """
+        Get the number of seconds until the next pending reminder is due.
+        
+        Returns:
+            Seconds until the earliest unsent future reminder, or None if there
+            is none (or the lookup failed).
+        """
+        try:
+            now = datetime.now(timezone.utc)
+            response = await run_query(
+                db.table("reminders").select("remind_time")
+                .eq("is_sent", False)
+                .gt("remind_time", now.isoformat())
+                .order("remind_time")
+                .limit(1)
+            )
+            
+            if not response.data:
+                return None
+            
+            next_time = datetime.fromisoformat(response.data[0]["remind_time"])
+            if next_time.tzinfo is None:
+                next_time = next_time.replace(tzinfo=timezone.utc)
+            return max((next_time - now).total_seconds(), 0.0)
+        
+        except Exception as e:
+            logger.warning(f"Error looking up next reminder: {e}")
+            return None
+    
+    async def _send_user_reminders(self, reminders: List[dict]) -> List[tuple]:
+        """Send one user's reminders in order (respecting per-user DM rate limits)."""
+        return [await self.send_reminder(reminder) for reminder in reminders]
+    
+    async def _get_user(self, user_id: int) -> Optional['discord.User']:
+        """Resolve a Discord user from our cache, then discord.py's cache, then the API."""
+        user = self._user_cache.get(user_id) or self.client.get_user(user_id)
+        if user is None:
+            user = await self.client.fetch_user(user_id)
+        if user is not None:
+            self._user_cache[user_id] = user
+        return user
+    
+    async def send_reminder(self, reminder: dict) -> tuple:
         """
         Send a reminder to a user via Discord DM.
         
         Args:
             reminder: Dictionary containing reminder data from database.
+        
+        Returns:
+            Tuple of (reminder_id, mark_sent). mark_sent is True when the
+            reminder should not be retried; the caller updates the database.
         """
+        reminder_id = reminder.get('id')
         try:
             user_id = reminder['user_id']
             message = reminder['message']
-            reminder_id = reminder['id']
             
             # Get the Discord user object
-            user = await self.client.fetch_user(user_id)
+            try:
+                user = await self._get_user(user_id)
+            except discord.NotFound:
+                # Deleted account: retrying can never succeed
+                user = None
             
             if user is None:
-                print(f"Could not find user {user_id}")
+                logger.warning(f"Could not find user {user_id}")
                 # Mark as sent anyway to avoid retrying
-                db.table("reminders").update({"is_sent": True}).eq("id", reminder_id).execute()
-                return
+                return reminder_id, True
             
             # Prepare the reminder message
             dm_message = f"⏰ **Reminder**: {message}"
@@ -71,46 +161,81 @@ class ReminderScheduler:
             # Try to send DM
             try:
                 await user.send(dm_message)
-                print(f"Sent reminder {reminder_id} to user {user_id}")
-                
-                # Mark as sent
-                db.table("reminders").update({"is_sent": True}).eq("id", reminder_id).execute()
+                logger.debug(f"Sent reminder {reminder_id} to user {user_id}")
                 
             except Exception as dm_error:
                 # User might have DMs disabled
-                print(f"Failed to send DM to user {user_id}: {dm_error}")
+                logger.warning(f"Failed to send DM to user {user_id}: {dm_error}")
                 
                 # Still mark as sent to avoid infinite retries
                 # In a production system, you might want to log this differently
-                db.table("reminders").update({"is_sent": True}).eq("id", reminder_id).execute()
+            
+            return reminder_id, True
         
         except Exception as e:
-            print(f"Error sending reminder {reminder.get('id', 'unknown')}: {e}")
+            logger.error(f"Error sending reminder {reminder_id or 'unknown'}: {e}")
+            return reminder_id, False
+    
+    def _next_interval(self, idle_polls: int) -> float:
+        """Polling interval after the given number of consecutive empty polls."""
+        return min(
+            config.REMINDER_POLL_MAX_INTERVAL,
+            config.REMINDER_POLL_BASE_INTERVAL * (self.BACKOFF_FACTOR ** idle_polls),
+        )
     
     async def run(self):
-        """Main loop that periodically checks for reminders."""
+        """
+        Main loop that periodically checks for reminders.
+        
+        Polls quickly after delivering reminders and backs off exponentially while
+        idle, but never sleeps past the next known reminder's due time.
+        notify() wakes the loop early when a reminder is added.
+        """
         self.running = True
-        print("Reminder scheduler started")
+        logger.info("Reminder scheduler started")
+        idle_polls = 0
         
         while self.running:
             try:
-                await self.check_and_send_reminders()
-                # Wait 30 seconds before next check
-                await asyncio.sleep(30)
+                sent = await self.check_and_send_reminders()
+                
+                if sent:
+                    idle_polls = 0
+                    interval = self._next_interval(idle_polls)
+                else:
+                    idle_polls = min(idle_polls + 1, self.MAX_BACKOFF_STEPS)
+                    interval = self._next_interval(idle_polls)
+                    next_due = await self.seconds_until_next_reminder()
+                    if next_due is not None:
+                        interval = min(interval, next_due)
+                
+                await self._sleep(interval)
             except Exception as e:
-                print(f"Error in reminder scheduler loop: {e}")
+                logger.exception(f"Error in reminder scheduler loop: {e}")
                 # Wait a bit before retrying to avoid tight error loops
                 await asyncio.sleep(60)
     
+    async def _sleep(self, seconds: float):
+        """Sleep for up to the given seconds, returning early if notified."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+    
+    def notify(self):
+        """Wake the polling loop so it re-checks the next due reminder."""
+        self._wake.set()
+    
     def start(self):
         """Start the scheduler as a background task."""
         if self.task is None or self.task.done():
             self.task = asyncio.create_task(self.run())
-            print("Reminder scheduler task created")
+            logger.debug("Reminder scheduler task created")
     
     def stop(self):
         """Stop the scheduler gracefully."""
         self.running = False
         if self.task and not self.task.done():
             self.task.cancel()
-            print("Reminder scheduler stopped")
+            logger.info("Reminder scheduler stopped")
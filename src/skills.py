@@ -30,14 +30,23 @@ SKILL.md Format:
     Scripts are in: {baseDir}/
 """
 
+import logging
 import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
+logger = logging.getLogger(__name__)
+
+# libyaml-backed loader when available; same safe semantics as SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Frontmatter block: '---' line, YAML, closing '---' line, then the body
+_FRONTMATTER_RE = re.compile(r'\A---[^\n]*\n(.*?)^[ \t\r]*---[ \t\r]*$\n?(.*)\Z', re.DOTALL | re.MULTILINE)
+
 
 @dataclass
 class Skill:
@@ -56,6 +65,20 @@ class SkillFrontmatter:
     description: str
 
 
+# Parsed skills keyed by (SKILL.md path, source) -> (fingerprint, Skill or None),
+# so unchanged files are not re-read and re-parsed on every prompt
+_skill_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Optional[Skill]]] = {}
+
+# Rendered SKILL.md content keyed by (path, base_dir) -> (fingerprint, content)
+_content_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], str]] = {}
+
+
+def _file_fingerprint(path: str) -> Tuple[int, int]:
+    """Return (mtime_ns, size) for a file; raises OSError if it can't be stat'ed."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
 def parse_frontmatter(content: str) -> Tuple[Optional[dict], str]:
     """
     Parse YAML frontmatter from markdown content.
@@ -66,28 +89,15 @@ def parse_frontmatter(content: str) -> Tuple[Optional[dict], str]:
     Returns:
         Tuple of (frontmatter_dict or None, remaining_content)
     """
-    # Check for frontmatter delimiter
-    if not content.startswith('---'):
-        return None, content
-    
-    # Find the closing delimiter
-    lines = content.split('\n')
-    end_idx = None
-    for i, line in enumerate(lines[1:], start=1):
-        if line.strip() == '---':
-            end_idx = i
-            break
-    
-    if end_idx is None:
+    # Opening delimiter line, then the YAML up to the first line that is
+    # just '---' (surrounding whitespace allowed), then the body
+    match = _FRONTMATTER_RE.match(content)
+    if match is None:
         return None, content
     
-    # Parse YAML frontmatter
-    frontmatter_text = '\n'.join(lines[1:end_idx])
-    remaining_content = '\n'.join(lines[end_idx + 1:])
-    
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        return frontmatter, remaining_content.strip()
+        frontmatter = yaml.load(match.group(1), Loader=_YAML_LOADER)
+        return frontmatter, match.group(2).strip()
     except yaml.YAMLError:
         return None, content
 
@@ -96,6 +106,8 @@ def load_skill_from_file(skill_md_path: str, source: str) -> Optional[Skill]:
     """
     Load a skill from a SKILL.md file.
     
+    Results are cached per file and reused until its mtime or size changes.
+    
     Args:
         skill_md_path: Path to the SKILL.md file.
         source: Source identifier ("global" or "user").
@@ -103,6 +115,33 @@ def load_skill_from_file(skill_md_path: str, source: str) -> Optional[Skill]:
     Returns:
         Skill object if valid, None otherwise.
     """
+    try:
+        return _load_skill_cached(skill_md_path, source)
+    except OSError as e:
+        logger.warning(f"Error loading skill from {skill_md_path}: {e}")
+        return None
+
+
+def _load_skill_cached(skill_md_path: str, source: str) -> Optional[Skill]:
+    """Cached load_skill_from_file; raises OSError if the file can't be stat'ed."""
+    key = (skill_md_path, source)
+    try:
+        fingerprint = _file_fingerprint(skill_md_path)
+    except OSError:
+        _skill_cache.pop(key, None)
+        raise
+    
+    cached = _skill_cache.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    skill = _parse_skill_file(skill_md_path, source)
+    _skill_cache[key] = (fingerprint, skill)
+    return skill
+
+
+def _parse_skill_file(skill_md_path: str, source: str) -> Optional[Skill]:
+    """Read and parse a SKILL.md file (uncached)."""
     try:
         with open(skill_md_path, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -129,7 +168,7 @@ def load_skill_from_file(skill_md_path: str, source: str) -> Optional[Skill]:
         )
         
     except Exception as e:
-        print(f"Error loading skill from {skill_md_path}: {e}")
+        logger.warning(f"Error loading skill from {skill_md_path}: {e}")
         return None
 
 
@@ -148,20 +187,28 @@ def load_skills_from_dir(directory: str, source: str) -> List[Skill]:
     """
     skills = []
     
-    if not os.path.isdir(directory):
-        return skills
-    
-    # Scan for skill directories
+    # Scan for skill directories; DirEntry.is_dir() reuses scandir's result,
+    # and a missing SKILL.md is detected by the load itself rather than a
+    # separate isfile() stat
     try:
-        for entry in os.scandir(directory):
-            if entry.is_dir():
-                skill_md_path = os.path.join(entry.path, 'SKILL.md')
-                if os.path.isfile(skill_md_path):
-                    skill = load_skill_from_file(skill_md_path, source)
-                    if skill:
-                        skills.append(skill)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                skill_md_path = entry.path + os.sep + 'SKILL.md'
+                try:
+                    skill = _load_skill_cached(skill_md_path, source)
+                except FileNotFoundError:
+                    continue  # Not a skill directory
+                except OSError as e:
+                    logger.warning(f"Error loading skill from {skill_md_path}: {e}")
+                    continue
+                if skill:
+                    skills.append(skill)
+    except (FileNotFoundError, NotADirectoryError):
+        pass  # No skills directory
     except Exception as e:
-        print(f"Error scanning skills directory {directory}: {e}")
+        logger.warning(f"Error scanning skills directory {directory}: {e}")
     
     return skills
 
@@ -221,42 +268,43 @@ def get_skill_content(skill: Skill) -> Optional[str]:
     """
     Read the full content of a skill's SKILL.md file.
     
+    The rendered content is cached until the file's mtime or size changes.
+    
     Args:
         skill: Skill object to read.
     
     Returns:
         Full SKILL.md content, or None if read fails.
     """
+    key = (skill.file_path, skill.base_dir)
     try:
+        fingerprint = _file_fingerprint(skill.file_path)
+        
+        cached = _content_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
         with open(skill.file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
         # Replace {baseDir} placeholder with actual path
         content = content.replace('{baseDir}', skill.base_dir)
         
+        _content_cache[key] = (fingerprint, content)
         return content
     except Exception as e:
-        print(f"Error reading skill content from {skill.file_path}: {e}")
+        _content_cache.pop(key, None)
+        logger.warning(f"Error reading skill content from {skill.file_path}: {e}")
         return None
 
 
-def create_skill_template(name: str, description: str) -> str:
-    """
-    Generate a template SKILL.md content for a new skill.
-    
-    Args:
-        name: Skill name.
-        description: Short description.
-    
-    Returns:
-        Template SKILL.md content.
-    """
-    return f"""---
+# SKILL.md scaffold for create_skill_template ({baseDir} stays a literal placeholder)
+_SKILL_TEMPLATE = """---
 name: {name}
 description: {description}
 ---
 
-# {name.replace('-', ' ').title()}
+# {title}
 
 {description}
 
@@ -275,3 +323,21 @@ bash {{baseDir}}/script.sh [arguments]
 
 Add any additional notes or documentation here.
 """
+
+
+def create_skill_template(name: str, description: str) -> str:
+    """
+    Generate a template SKILL.md content for a new skill.
+    
+    Args:
+        name: Skill name.
+        description: Short description.
+    
+    Returns:
+        Template SKILL.md content.
+    """
+    return _SKILL_TEMPLATE.format(
+        name=name,
+        title=name.replace('-', ' ').title(),
+        description=description,
+    )
@@ -6,9 +6,10 @@ Provides the ToolSpec dataclass and tool registration utilities
 for the custom CortanaAgent orchestrator.
 """
 
+import copy
 import inspect
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, get_type_hints
 
@@ -17,6 +18,10 @@ from pydantic import BaseModel, Field, create_model
 
 ToolFn = Callable[..., Awaitable[str]]
 
+# Specs built by create_tool_spec, keyed by function, so re-registering a tool
+# doesn't re-inspect it and rebuild its Pydantic model
+_tool_spec_cache: Dict[Callable, "ToolSpec"] = {}
+
 
 @dataclass
 class ToolSpec:
@@ -33,9 +38,24 @@ class ToolSpec:
     description: str
     fn: ToolFn
     input_model: Type[BaseModel]
+    _openai_tool: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Build the schema once up front; it's fixed for the spec's lifetime
+        self._openai_tool = self._build_openai_tool()
     
     def openai_tool(self) -> Dict[str, Any]:
-        """Convert to OpenAI tools format for API calls."""
+        """
+        Convert to OpenAI tools format for API calls.
+        
+        Returns a fresh copy of the prebuilt schema: providers (e.g. litellm's
+        Gemini transform) edit tool schemas in place, which must not leak into
+        later calls.
+        """
+        return copy.deepcopy(self._openai_tool)
+    
+    def _build_openai_tool(self) -> Dict[str, Any]:
+        """Build the OpenAI tool definition from the input model's JSON schema."""
         schema = self.input_model.model_json_schema()
         
         # Remove title and definitions that OpenAI doesn't need
@@ -101,8 +121,12 @@ def create_tool_spec(fn: ToolFn) -> ToolSpec:
         fn: The async tool function to wrap.
     
     Returns:
-        ToolSpec with auto-generated input model.
+        ToolSpec with auto-generated input model (cached per function).
     """
+    cached = _tool_spec_cache.get(fn)
+    if cached is not None:
+        return cached
+    
     name = fn.__name__
     docstring = fn.__doc__ or ""
     
@@ -111,7 +135,7 @@ def create_tool_spec(fn: ToolFn) -> ToolSpec:
     
     # Get function signature
     sig = inspect.signature(fn)
-    hints = get_type_hints(fn)
+    hints = get_type_hints(fn, include_extras=True)  # keep Annotated constraints
     
     # Build field definitions for Pydantic model (skip 'ctx' parameter)
     fields: Dict[str, Any] = {}
@@ -142,12 +166,14 @@ def create_tool_spec(fn: ToolFn) -> ToolSpec:
     model_name = f"{name.title().replace('_', '')}Args"
     input_model = create_model(model_name, **fields)
     
-    return ToolSpec(
+    spec = ToolSpec(
         name=name,
         description=description,
         fn=fn,
         input_model=input_model,
     )
+    _tool_spec_cache[fn] = spec
+    return spec
 
 
 class ToolRegistry:
@@ -159,6 +185,8 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: Dict[str, ToolSpec] = {}
+        # Built on first openai_tools() call; reset whenever a tool is registered
+        self._openai_tools_cache: Optional[List[Dict[str, Any]]] = None
     
     def register(self, fn: ToolFn) -> ToolFn:
         """
@@ -174,11 +202,13 @@ class ToolRegistry:
         """
         spec = create_tool_spec(fn)
         self._tools[spec.name] = spec
+        self._openai_tools_cache = None
         return fn
     
     def register_spec(self, spec: ToolSpec) -> None:
         """Register a pre-built ToolSpec."""
         self._tools[spec.name] = spec
+        self._openai_tools_cache = None
     
     def get(self, name: str) -> Optional[ToolSpec]:
         """Get a tool by name."""
@@ -189,8 +219,16 @@ class ToolRegistry:
         return list(self._tools.values())
     
     def openai_tools(self) -> List[Dict[str, Any]]:
-        """Get all tools in OpenAI format."""
-        return [t.openai_tool() for t in self._tools.values()]
+        """
+        Get all tools in OpenAI format.
+        
+        The prebuilt schemas are collected once until the next registration;
+        each call returns fresh copies, since callers and provider transforms
+        may edit the payload in place.
+        """
+        if self._openai_tools_cache is None:
+            self._openai_tools_cache = [t._openai_tool for t in self._tools.values()]
+        return [copy.deepcopy(t) for t in self._openai_tools_cache]
     
     def __len__(self) -> int:
         return len(self._tools)
@@ -1,57 +1,156 @@
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Annotated, Optional, List, Dict, Any, Literal, Tuple
 import aiohttp
-from bs4 import BeautifulSoup
+from pydantic import Field
+from bs4 import BeautifulSoup, SoupStrainer
 from exa_py import Exa
 from .config import config
-from .database import db
+from .database import db, run_query
 from .memory import memory_client
 from .cortana_context import CortanaContext
 
-# --- Data Models ---
-
-class Todo(BaseModel):
-    id: int
-    content: str
-    status: str
-    due_date: Optional[datetime] = None
-    priority: int
-
-class CalendarEvent(BaseModel):
-    id: int
-    title: str
-    start_time: datetime
-    end_time: datetime
-    location: Optional[str] = None
-
-class Reminder(BaseModel):
-    id: int
-    user_id: int
-    message: str
-    remind_time: datetime
-    is_sent: bool
-    related_event_id: Optional[int] = None
-    created_at: datetime
+logger = logging.getLogger(__name__)
+
+# --- Tool Argument Types ---
+
+# Allowed values, mirrored from the schema's CHECK constraint and priority range;
+# they become an enum / min-max bounds in the tool schema, so bad values are
+# rejected during argument validation instead of by a database round trip
+# (priority stays a constrained int so numeric strings like "3" still coerce)
+TodoStatus = Literal["PENDING", "COMPLETED", "ARCHIVED"]
+TodoPriority = Annotated[int, Field(ge=1, le=5)]
 
 # --- Helper Functions ---
 
+# Shared HTTP session for outbound fetches (created lazily on first use so it
+# binds to the running event loop, then reused to keep connections alive)
+_http_session: Optional[aiohttp.ClientSession] = None
+
+async def _get_http_session() -> aiohttp.ClientSession:
+    """Get or create the shared aiohttp session."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=60)
+        )
+    return _http_session
+
+# Parser for fetch_url: lxml's C parser is much faster and lighter than the
+# pure-Python html.parser, which remains the fallback if lxml is unavailable
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# fetch_url only reads the title, meta descriptions and body text; skip building
+# nodes for everything else in <head> (scripts, styles, links)
+_FETCH_STRAINER = SoupStrainer(["title", "meta", "body"])
+
+def _parse_fetched_html(html: str) -> BeautifulSoup:
+    """
+    Parse a fetched page, restricted to the tags fetch_url reads when safe.
+    
+    Straining relies on the parser creating an implied <body> for bare content,
+    which lxml does but html.parser does not; pages that still come back without
+    a body are re-parsed in full so their text is not dropped.
+    """
+    if _HTML_PARSER == "lxml":
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_FETCH_STRAINER)
+        if soup.body is not None:
+            return soup
+    return BeautifulSoup(html, _HTML_PARSER)
+
+# Shared Exa client (keeps its underlying HTTP session alive between searches)
+_exa_client: Optional[Exa] = None
+
+def _get_exa_client() -> Exa:
+    """Get or create the shared Exa client."""
+    global _exa_client
+    if _exa_client is None:
+        _exa_client = Exa(api_key=config.EXA_API_KEY)
+    return _exa_client
+
+async def close_http_session() -> None:
+    """Close the shared aiohttp session and release pooled connections."""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+# Resolved tzinfo per timezone name, so changing DEFAULT_TIMEZONE still takes effect
+_TZ_CACHE: Dict[str, tzinfo] = {}
+
+def _resolve_tz(name: str) -> tzinfo:
+    """Resolve a timezone name via zoneinfo, then pytz, falling back to UTC."""
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(name)
+    except Exception:
+        try:
+            import pytz
+            return pytz.timezone(name)
+        except Exception:
+            return timezone.utc
+
+def get_default_tz() -> tzinfo:
+    """Get the tzinfo for config.DEFAULT_TIMEZONE, resolving it once per name."""
+    name = config.DEFAULT_TIMEZONE
+    tz = _TZ_CACHE.get(name)
+    if tz is None:
+        tz = _TZ_CACHE[name] = _resolve_tz(name)
+    return tz
+
+# Users already confirmed in user_settings (LRU-bounded); later writes skip the DB call
+_KNOWN_USERS_MAX = 10_000
+_known_users: "OrderedDict[int, None]" = OrderedDict()
+
 async def ensure_user_exists(user_id: int) -> None:
     """Ensure user exists in user_settings table."""
+    if user_id in _known_users:
+        _known_users.move_to_end(user_id)
+        return
     try:
-        # Check if user exists
-        response = db.table("user_settings").select("user_id").eq("user_id", user_id).execute()
-        if not response.data:
-            # User doesn't exist, create it
-            db.table("user_settings").insert({"user_id": user_id}).execute()
+        # Single idempotent round trip: insert, or do nothing if the row exists
+        await run_query(db.table("user_settings").upsert(
+            {"user_id": user_id}, on_conflict="user_id", ignore_duplicates=True
+        ))
+        _known_users[user_id] = None
+        if len(_known_users) > _KNOWN_USERS_MAX:
+            _known_users.popitem(last=False)
     except Exception as e:
-        # If error is not about duplicate, log it
-        if "duplicate" not in str(e).lower():
-            print(f"Error ensuring user exists: {e}")
+        logger.warning(f"Error ensuring user exists: {e}")
+
+# Short-lived cache of rendered list_todos/list_reminders output, grouped per
+# (table, user_id) so a write can drop all of that user's entries at once
+_LIST_CACHE_TTL = 2.0
+_LIST_CACHE_MAX_USERS = 4096
+_list_cache: Dict[Tuple[str, int], Dict[tuple, Tuple[float, str]]] = {}
+
+def _list_cache_get(table: str, user_id: int, key: tuple) -> Optional[str]:
+    """Get a cached list result if it is younger than _LIST_CACHE_TTL."""
+    entry = _list_cache.get((table, user_id), {}).get(key)
+    if entry is not None and time.monotonic() - entry[0] < _LIST_CACHE_TTL:
+        return entry[1]
+    return None
+
+def _list_cache_put(table: str, user_id: int, key: tuple, result: str) -> None:
+    """Cache a rendered list result."""
+    if (table, user_id) not in _list_cache and len(_list_cache) >= _LIST_CACHE_MAX_USERS:
+        _list_cache.clear()
+    _list_cache.setdefault((table, user_id), {})[key] = (time.monotonic(), result)
+
+def invalidate_list_cache(table: str, user_id: int) -> None:
+    """Drop cached list results for a user after a write to the given table."""
+    _list_cache.pop((table, user_id), None)
 
 # --- Transaction Tools ---
 
-async def add_todo(ctx: CortanaContext, content: str, due_date: Optional[datetime] = None, priority: int = 3) -> str:
+async def add_todo(ctx: CortanaContext, content: str, due_date: Optional[datetime] = None, priority: TodoPriority = 3) -> str:
     """
     Adds a new item to the user's To-Do list.
     
@@ -74,12 +173,13 @@ async def add_todo(ctx: CortanaContext, content: str, due_date: Optional[datetim
         data["due_date"] = due_date.isoformat()
     
     try:
-        response = db.table("todos").insert(data).execute()
+        response = await run_query(db.table("todos").insert(data))
+        invalidate_list_cache("todos", user_id)
         return f"Todo added: {content}"
     except Exception as e:
         return f"Error adding todo: {str(e)}"
 
-async def list_todos(ctx: CortanaContext, status: str = "PENDING", limit: int = 10) -> str:
+async def list_todos(ctx: CortanaContext, status: TodoStatus = "PENDING", limit: int = 10) -> str:
     """
     Lists the user's To-Do items.
     
@@ -88,16 +188,22 @@ async def list_todos(ctx: CortanaContext, status: str = "PENDING", limit: int =
         limit: Max number of items to return.
     """
     user_id = ctx.deps['user_info']['id']
+    cache_key = (status, limit)
+    cached = _list_cache_get("todos", user_id, cache_key)
+    if cached is not None:
+        return cached
     try:
-        response = db.table("todos").select("*").eq("user_id", user_id).eq("status", status).order("created_at", desc=True).limit(limit).execute()
-        todos = [Todo(**item) for item in response.data]
-        if not todos:
-            return f"No {status.lower()} todos found."
-        
-        result = f"**{status} Todos:**\n"
-        for todo in todos:
-            due_info = f" (Due: {todo.due_date})" if todo.due_date else ""
-            result += f"- [{todo.id}] {todo.content}{due_info}\n"
+        response = await run_query(db.table("todos").select("id,content,due_date").eq("user_id", user_id).eq("status", status).order("created_at", desc=True).limit(limit))
+        if not response.data:
+            result = f"No {status.lower()} todos found."
+        else:
+            # Rows come straight from our own schema; format them without model validation
+            lines = [
+                f"- [{t['id']}] {t['content']}" + (f" (Due: {t['due_date']})" if t.get('due_date') else "")
+                for t in response.data
+            ]
+            result = f"**{status} Todos:**\n" + "\n".join(lines) + "\n"
+        _list_cache_put("todos", user_id, cache_key, result)
         return result
     except Exception as e:
         return f"Error listing todos: {str(e)}"
@@ -111,12 +217,12 @@ async def complete_todo(ctx: CortanaContext, todo_id: int) -> str:
     """
     user_id = ctx.deps['user_info']['id']
     try:
-        # Verify ownership
-        response = db.table("todos").select("*").eq("id", todo_id).eq("user_id", user_id).execute()
+        # Filtering on user_id enforces ownership; no rows back means not found
+        response = await run_query(db.table("todos").update({"status": "COMPLETED"}).eq("id", todo_id).eq("user_id", user_id))
         if not response.data:
             return "Todo not found or access denied."
         
-        db.table("todos").update({"status": "COMPLETED"}).eq("id", todo_id).execute()
+        invalidate_list_cache("todos", user_id)
         return f"Todo {todo_id} marked as completed."
     except Exception as e:
         return f"Error completing todo: {str(e)}"
@@ -144,11 +250,14 @@ async def add_calendar_event(ctx: CortanaContext, title: str, start_time: dateti
         "location": location
     }
     try:
-        db.table("calendar_events").insert(data).execute()
+        await run_query(db.table("calendar_events").insert(data))
         return f"Event added: {title} at {start_time}"
     except Exception as e:
         return f"Error adding event: {str(e)}"
 
+# Conflicts listed by check_calendar_availability before summarizing the rest
+_MAX_CONFLICTS_SHOWN = 5
+
 async def check_calendar_availability(ctx: CortanaContext, start_range: datetime, end_range: datetime) -> str:
     """
     Checks for conflicting events in a given time range.
@@ -160,15 +269,21 @@ async def check_calendar_availability(ctx: CortanaContext, start_range: datetime
     user_id = ctx.deps['user_info']['id']
     try:
         # Overlap logic: (StartA <= EndB) and (EndA >= StartB)
-        response = db.table("calendar_events").select("*") \
-            .eq("user_id", user_id) \
-            .lte("start_time", end_range.isoformat()) \
-            .gte("end_time", start_range.isoformat()) \
-            .execute()
+        # Only the columns used in the conflict summary are fetched, and one row
+        # past the display cap tells us whether more conflicts exist
+        response = await run_query(
+            db.table("calendar_events").select("title,start_time,end_time")
+            .eq("user_id", user_id)
+            .lte("start_time", end_range.isoformat())
+            .gte("end_time", start_range.isoformat())
+            .order("start_time")
+            .limit(_MAX_CONFLICTS_SHOWN + 1)
+        )
         
         if response.data:
-            events = [f"{e['title']} ({e['start_time']} - {e['end_time']})" for e in response.data]
-            return f"Conflicts found: {', '.join(events)}"
+            events = [f"{e['title']} ({e['start_time']} - {e['end_time']})" for e in response.data[:_MAX_CONFLICTS_SHOWN]]
+            more = " (and more)" if len(response.data) > _MAX_CONFLICTS_SHOWN else ""
+            return f"Conflicts found: {', '.join(events)}{more}"
         else:
             return "No conflicts found in this time range."
     except Exception as e:
@@ -184,8 +299,7 @@ async def search_long_term_memory(ctx: CortanaContext, query: str, limit: int =
         query: The search query.
         limit: Number of results to return (currently not used, returns full context).
     """
-    user_id = str(ctx.deps['user_info']['id'])
-    thread_id = f"discord_{user_id}"
+    thread_id = f"discord_{ctx.deps['user_info']['id']}"
     
     try:
         # Get user context from Zep
@@ -198,6 +312,20 @@ async def search_long_term_memory(ctx: CortanaContext, query: str, limit: int =
     except Exception as e:
         return f"Error searching memory: {str(e)}"
 
+async def gather_context(ctx: CortanaContext, query: str) -> str:
+    """
+    Retrieves long-term memory and pending todos together in one step.
+    
+    Args:
+        query: The memory search query.
+    """
+    # Zep and Supabase are independent round trips; run them concurrently
+    memory, todos = await asyncio.gather(
+        search_long_term_memory(ctx, query),
+        list_todos(ctx),
+    )
+    return f"{memory}\n\n{todos}"
+
 async def get_unread_emails(ctx: CortanaContext, limit: int = 5) -> str:
     """
     Mock function to get unread emails.
@@ -213,13 +341,13 @@ async def fetch_url(ctx: CortanaContext, url: str) -> str:
         url: The URL to fetch.
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    return f"Error fetching URL: {response.status} {response.reason}"
-                html = await response.text()
+        session = await _get_http_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                return f"Error fetching URL: {response.status} {response.reason}"
+            html = await response.text()
                 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = _parse_fetched_html(html)
         title = soup.title.string if soup.title else "No title"
         
         # Get meta description
@@ -228,7 +356,7 @@ async def fetch_url(ctx: CortanaContext, url: str) -> str:
         if meta:
             meta_desc = meta.get('content', '')
             
-        # Get accessible text content
+        # Get accessible text content (scripts/styles inside <body> still get parsed)
         for script in soup(["script", "style"]):
             script.decompose()
             
@@ -252,7 +380,7 @@ async def search_web_exa(ctx: CortanaContext, query: str) -> str:
         query: The search query.
     """
     try:
-        exa = Exa(api_key=config.EXA_API_KEY)
+        exa = _get_exa_client()
         response = exa.search(
             query,
             type="auto",
@@ -276,7 +404,7 @@ async def get_contents_exa(ctx: CortanaContext, urls: List[str]) -> str:
         urls: List of URLs to retrieve.
     """
     try:
-        exa = Exa(api_key=config.EXA_API_KEY)
+        exa = _get_exa_client()
         response = exa.get_contents(
             urls,
             text=True
@@ -303,23 +431,8 @@ async def add_reminder(ctx: CortanaContext, message: str, remind_time: datetime,
     """
     user_id = ctx.deps['user_info']['id']
     
-    # Ensure user exists in database
-    await ensure_user_exists(user_id)
-    
     # Validate that remind_time is in the future
-    try:
-        from zoneinfo import ZoneInfo
-        from .config import config
-        tz = ZoneInfo(config.DEFAULT_TIMEZONE)
-    except Exception:
-        try:
-            import pytz
-            from .config import config
-            tz = pytz.timezone(config.DEFAULT_TIMEZONE)
-        except Exception:
-            from datetime import timezone
-            tz = timezone.utc
-    
+    tz = get_default_tz()
     now = datetime.now(tz)
     
     # Make remind_time timezone-aware if it's not
@@ -329,6 +442,9 @@ async def add_reminder(ctx: CortanaContext, message: str, remind_time: datetime,
     if remind_time <= now:
         return "Error: Reminder time must be in the future. Cannot create reminders for past times."
     
+    # Ensure user exists in database (after validation, so rejected input costs no round trip)
+    await ensure_user_exists(user_id)
+    
     data = {
         "user_id": user_id,
         "message": message,
@@ -337,7 +453,14 @@ async def add_reminder(ctx: CortanaContext, message: str, remind_time: datetime,
     }
     
     try:
-        response = db.table("reminders").insert(data).execute()
+        response = await run_query(db.table("reminders").insert(data))
+        invalidate_list_cache("reminders", user_id)
+        
+        # Let the scheduler re-plan its sleep around the new reminder
+        scheduler = ctx.deps.get("reminder_scheduler")
+        if scheduler is not None:
+            scheduler.notify()
+        
         if response.data:
             reminder_id = response.data[0]['id']
             return f"Reminder set: '{message}' at {remind_time.strftime('%Y-%m-%d %H:%M %Z')} (ID: {reminder_id})"
@@ -354,27 +477,35 @@ async def list_reminders(ctx: CortanaContext, include_sent: bool = False, limit:
         limit: Maximum number of reminders to return.
     """
     user_id = ctx.deps['user_info']['id']
+    cache_key = (include_sent, limit)
+    cached = _list_cache_get("reminders", user_id, cache_key)
+    if cached is not None:
+        return cached
     
     try:
-        query = db.table("reminders").select("*").eq("user_id", user_id)
+        query = db.table("reminders").select("id,message,remind_time,is_sent,related_event_id").eq("user_id", user_id)
         
         if not include_sent:
             query = query.eq("is_sent", False)
         
-        response = query.order("remind_time", desc=False).limit(limit).execute()
+        response = await run_query(query.order("remind_time", desc=False).limit(limit))
         
         if not response.data:
             status = "reminders" if include_sent else "pending reminders"
-            return f"No {status} found."
-        
-        reminders = [Reminder(**item) for item in response.data]
-        
-        result = "**Your Reminders:**\n"
-        for reminder in reminders:
-            status_icon = "✅" if reminder.is_sent else "⏰"
-            event_info = f" (Event #{reminder.related_event_id})" if reminder.related_event_id else ""
-            result += f"{status_icon} [{reminder.id}] {reminder.message} - {reminder.remind_time.strftime('%Y-%m-%d %H:%M')}{event_info}\n"
-        
+            result = f"No {status} found."
+        else:
+            # Format raw rows directly. remind_time arrives as an ISO-8601 string
+            # (YYYY-MM-DDTHH:MM:SS...), so its first 16 chars are the minute-precision
+            # timestamp; no datetime parse/strftime round trip is needed
+            lines = [
+                f"{'✅' if r['is_sent'] else '⏰'} [{r['id']}] {r['message']} - "
+                f"{r['remind_time'][:16].replace('T', ' ')}"
+                + (f" (Event #{r['related_event_id']})" if r.get('related_event_id') else "")
+                for r in response.data
+            ]
+            result = "**Your Reminders:**\n" + "\n".join(lines) + "\n"
+        
+        _list_cache_put("reminders", user_id, cache_key, result)
         return result
     except Exception as e:
         return f"Error listing reminders: {str(e)}"
@@ -389,20 +520,25 @@ async def cancel_reminder(ctx: CortanaContext, reminder_id: int) -> str:
     user_id = ctx.deps['user_info']['id']
     
     try:
-        # Verify ownership and that reminder exists
-        response = db.table("reminders").select("*").eq("id", reminder_id).eq("user_id", user_id).execute()
-        
-        if not response.data:
-            return "Reminder not found or access denied."
-        
-        reminder = Reminder(**response.data[0])
+        # Filtering on user_id and is_sent enforces ownership and pending state
+        # in the DELETE itself; the deleted row comes back for the confirmation
+        response = await run_query(
+            db.table("reminders").delete()
+            .eq("id", reminder_id)
+            .eq("user_id", user_id)
+            .eq("is_sent", False)
+        )
+        if response.data:
+            invalidate_list_cache("reminders", user_id)
+            return f"Reminder {reminder_id} has been cancelled: '{response.data[0]['message']}'"
         
-        if reminder.is_sent:
+        # Nothing deleted: look up why (only on this failure path)
+        response = await run_query(
+            db.table("reminders").select("is_sent").eq("id", reminder_id).eq("user_id", user_id)
+        )
+        if response.data and response.data[0]['is_sent']:
             return f"Reminder {reminder_id} has already been sent and cannot be cancelled."
-        
-        # Delete the reminder
-        db.table("reminders").delete().eq("id", reminder_id).execute()
-        return f"Reminder {reminder_id} has been cancelled: '{reminder.message}'"
+        return "Reminder not found or access denied."
     except Exception as e:
         return f"Error cancelling reminder: {str(e)}"
 
@@ -473,6 +609,27 @@ def _format_size(bytes_count: int) -> str:
         return f"{bytes_count / (1024 * 1024):.1f}MB"
 
 
+def _sync_read_lines(path: str) -> List[str]:
+    """Synchronous line read for executor."""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.readlines()
+
+
+def _sync_read_text(path: str) -> str:
+    """Synchronous text read for executor."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _sync_write_text(path: str, content: str) -> None:
+    """Synchronous text write for executor (creates parent directories)."""
+    parent_dir = os.path.dirname(path)
+    if parent_dir and not os.path.exists(parent_dir):
+        os.makedirs(parent_dir, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
 async def execute_bash(ctx: CortanaContext, command: str, timeout: Optional[int] = None) -> str:
     """
     Execute a bash command in the container environment.
@@ -489,7 +646,7 @@ async def execute_bash(ctx: CortanaContext, command: str, timeout: Optional[int]
         Command output (stdout + stderr combined).
     """
     if timeout is None:
-        timeout = config.BASH_TIMEOUT_DEFAULT if hasattr(config, 'BASH_TIMEOUT_DEFAULT') else 60
+        timeout = config.BASH_TIMEOUT_DEFAULT
     
     try:
         # Create subprocess
@@ -497,7 +654,7 @@ async def execute_bash(ctx: CortanaContext, command: str, timeout: Optional[int]
             command,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,  # Combine stderr into stdout
-            cwd=config.WORKSPACE_DIR if hasattr(config, 'WORKSPACE_DIR') else '/workspace'
+            cwd=config.WORKSPACE_DIR
         )
         
         try:
@@ -548,7 +705,7 @@ async def read_file(ctx: CortanaContext, path: str, offset: Optional[int] = None
     """
     try:
         # Resolve path
-        workspace = config.WORKSPACE_DIR if hasattr(config, 'WORKSPACE_DIR') else '/workspace'
+        workspace = config.WORKSPACE_DIR
         if not os.path.isabs(path):
             path = os.path.join(workspace, path)
         
@@ -570,9 +727,9 @@ async def read_file(ctx: CortanaContext, path: str, offset: Optional[int] = None
         except Exception as e:
             return f"Error checking file: {str(e)}"
         
-        # Read file
-        with open(real_path, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()
+        # Read file (off the event loop)
+        loop = asyncio.get_running_loop()
+        lines = await loop.run_in_executor(None, _sync_read_lines, real_path)
         
         total_lines = len(lines)
         
@@ -590,7 +747,7 @@ async def read_file(ctx: CortanaContext, path: str, offset: Optional[int] = None
             end_idx = min(total_lines, start_idx + limit)
         
         # Apply default limit if file is too large
-        max_lines = config.FILE_READ_MAX_LINES if hasattr(config, 'FILE_READ_MAX_LINES') else 1000
+        max_lines = config.FILE_READ_MAX_LINES
         if end_idx - start_idx > max_lines:
             end_idx = start_idx + max_lines
         
@@ -630,20 +787,15 @@ async def write_file(ctx: CortanaContext, path: str, content: str) -> str:
     """
     try:
         # Resolve path
-        workspace = config.WORKSPACE_DIR if hasattr(config, 'WORKSPACE_DIR') else '/workspace'
+        workspace = config.WORKSPACE_DIR
         if not os.path.isabs(path):
             path = os.path.join(workspace, path)
         
         real_path = os.path.realpath(path)
         
-        # Create parent directories if needed
-        parent_dir = os.path.dirname(real_path)
-        if parent_dir and not os.path.exists(parent_dir):
-            os.makedirs(parent_dir, exist_ok=True)
-        
-        # Write file
-        with open(real_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Write file, creating parent directories if needed (off the event loop)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _sync_write_text, real_path, content)
         
         bytes_written = len(content.encode('utf-8'))
         
@@ -670,7 +822,7 @@ async def edit_file(ctx: CortanaContext, path: str, old_text: str, new_text: str
     """
     try:
         # Resolve path
-        workspace = config.WORKSPACE_DIR if hasattr(config, 'WORKSPACE_DIR') else '/workspace'
+        workspace = config.WORKSPACE_DIR
         if not os.path.isabs(path):
             path = os.path.join(workspace, path)
         
@@ -682,9 +834,9 @@ async def edit_file(ctx: CortanaContext, path: str, old_text: str, new_text: str
         if not os.path.isfile(real_path):
             return f"Error: Path is not a file: {path}"
         
-        # Read current content
-        with open(real_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Read current content (off the event loop)
+        loop = asyncio.get_running_loop()
+        content = await loop.run_in_executor(None, _sync_read_text, real_path)
         
         # Check if old_text exists
         if old_text not in content:
@@ -700,8 +852,7 @@ async def edit_file(ctx: CortanaContext, path: str, old_text: str, new_text: str
         new_content = content.replace(old_text, new_text)
         
         # Write back
-        with open(real_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        await loop.run_in_executor(None, _sync_write_text, real_path, new_content)
         
         # Generate diff preview
         old_preview = old_text[:100] + "..." if len(old_text) > 100 else old_text
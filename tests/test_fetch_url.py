@@ -0,0 +1,91 @@
+"""
+Tests for fetch_url HTML parsing.
+
+The HTTP session is mocked, so these run without network access.
+"""
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+
+import sys
+import os
+
+# Setup path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Mock external dependencies before importing src modules
+sys.modules['zep_cloud'] = MagicMock()
+sys.modules['zep_cloud.client'] = MagicMock()
+sys.modules['zep_cloud.types'] = MagicMock()
+sys.modules['supabase'] = MagicMock()
+sys.modules['exa_py'] = MagicMock()
+sys.modules['rotator_library'] = MagicMock()
+
+
+def _mock_session(html: str) -> MagicMock:
+    """Build a mock aiohttp session whose get() returns the given HTML."""
+    response = MagicMock()
+    response.status = 200
+    response.text = AsyncMock(return_value=html)
+
+    request = MagicMock()
+    request.__aenter__ = AsyncMock(return_value=response)
+    request.__aexit__ = AsyncMock(return_value=False)
+
+    session = MagicMock()
+    session.get = MagicMock(return_value=request)
+    return session
+
+
+def _parsers():
+    """Parsers fetch_url can run with in this environment."""
+    parsers = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        parsers.append("lxml")
+    except ImportError:
+        pass
+    return parsers
+
+
+@pytest.mark.parametrize("parser", _parsers())
+class TestFetchUrlParsing:
+    """Tests for the text fetch_url extracts from a page."""
+
+    async def _fetch(self, html: str, parser: str) -> str:
+        from src import tools
+
+        with patch.object(tools, "_HTML_PARSER", parser), \
+             patch.object(tools, "_get_http_session", AsyncMock(return_value=_mock_session(html))):
+            return await tools.fetch_url(MagicMock(), "https://example.com")
+
+    @pytest.mark.asyncio
+    async def test_full_page(self, parser):
+        html = (
+            "<html><head><title>T</title>"
+            "<meta name=\"description\" content=\"D\"><script>var x = 1;</script></head>"
+            "<body><p>Hello</p><script>ignored()</script></body></html>"
+        )
+
+        result = await self._fetch(html, parser)
+
+        assert "Title: T" in result
+        assert "Description: D" in result
+        assert "Hello" in result
+        assert "ignored" not in result
+        assert "var x" not in result
+
+    @pytest.mark.asyncio
+    async def test_fragment_without_body_tag(self, parser):
+        result = await self._fetch("<p>No body tag here</p>", parser)
+
+        assert "No body tag here" in result
+
+    @pytest.mark.asyncio
+    async def test_implicit_body(self, parser):
+        html = "<html><head><title>T</title></head><p>implicit body</p></html>"
+
+        result = await self._fetch(html, parser)
+
+        assert "Title: T" in result
+        assert "implicit body" in result
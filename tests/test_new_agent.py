@@ -115,6 +115,70 @@ class TestTooling:
         openai_tool = spec.openai_tool()
         assert openai_tool["function"]["name"] == "schedule"
     
+    def test_tool_with_literal_choices(self):
+        from typing import Literal
+        from pydantic import ValidationError
+        from src.tooling import create_tool_spec
+        from src.cortana_context import CortanaContext
+        
+        async def list_items(ctx: CortanaContext, status: Literal["PENDING", "COMPLETED"] = "PENDING") -> str:
+            """List items by status."""
+            return status
+        
+        spec = create_tool_spec(list_items)
+        
+        params = spec.openai_tool()["function"]["parameters"]
+        assert params["properties"]["status"]["enum"] == ["PENDING", "COMPLETED"]
+        with pytest.raises(ValidationError):
+            spec.input_model.model_validate({"status": "DONE"})
+    
+    def test_tool_with_constrained_int(self):
+        from typing import Annotated
+        from pydantic import Field, ValidationError
+        from src.tooling import create_tool_spec
+        from src.cortana_context import CortanaContext
+        
+        async def rate(ctx: CortanaContext, score: Annotated[int, Field(ge=1, le=5)] = 3) -> str:
+            """Rate something."""
+            return str(score)
+        
+        spec = create_tool_spec(rate)
+        
+        score = spec.openai_tool()["function"]["parameters"]["properties"]["score"]
+        assert (score["minimum"], score["maximum"]) == (1, 5)
+        assert spec.input_model.model_validate({"score": "4"}).score == 4
+        with pytest.raises(ValidationError):
+            spec.input_model.model_validate({"score": 9})
+    
+    def test_tool_spec_cached_per_function(self):
+        from src.tooling import create_tool_spec
+        from src.cortana_context import CortanaContext
+        
+        async def echo(ctx: CortanaContext, text: str) -> str:
+            """Echo text back."""
+            return text
+        
+        spec = create_tool_spec(echo)
+        
+        assert create_tool_spec(echo) is spec
+        assert spec.openai_tool() == spec.openai_tool()
+    
+    def test_openai_tool_returns_independent_copies(self):
+        from src.tooling import create_tool_spec
+        from src.cortana_context import CortanaContext
+        
+        async def shout(ctx: CortanaContext, text: str) -> str:
+            """Shout text back."""
+            return text.upper()
+        
+        spec = create_tool_spec(shout)
+        
+        # Simulate a provider transform stripping schema keys in place
+        tool = spec.openai_tool()
+        tool["function"]["parameters"].clear()
+        
+        assert spec.openai_tool()["function"]["parameters"]["properties"]["text"]["type"] == "string"
+    
     def test_tool_registry(self):
         from src.tooling import ToolRegistry
         from src.cortana_context import CortanaContext
@@ -138,6 +202,20 @@ class TestTooling:
         
         tools = registry.openai_tools()
         assert len(tools) == 2
+        assert registry.openai_tools() == tools
+        
+        # Mutating a returned payload must not affect later calls
+        tools[0]["function"]["parameters"].clear()
+        tools.pop()
+        assert len(registry.openai_tools()) == 2
+        assert "properties" in registry.openai_tools()[0]["function"]["parameters"]
+        
+        async def tool_c(ctx: CortanaContext, z: str) -> str:
+            """Tool C."""
+            return z
+        
+        registry.register(tool_c)
+        assert len(registry.openai_tools()) == 3
 
 
 class TestCortanaAgent:
@@ -68,6 +68,17 @@ class TestNormalizeModelName:
         # Known providers
         assert normalize_model_name("qwen-turbo") == "qwen/qwen-turbo"
         assert normalize_model_name("deepseek-chat") == "deepseek/deepseek-chat"
+    
+    def test_prefer_oauth(self):
+        """prefer_oauth should select the OAuth provider where one exists."""
+        from src.rotator_client import normalize_model_name
+        
+        assert normalize_model_name("gemini-2.5-flash", prefer_oauth=True) == "gemini_cli/gemini-2.5-flash"
+        assert normalize_model_name("qwen-turbo", prefer_oauth=True) == "qwen_code/qwen-turbo"
+        assert normalize_model_name("gpt-4o", prefer_oauth=True) == "openai/gpt-4o"
+        # The cached non-OAuth result must not leak into the OAuth lookup
+        assert normalize_model_name("gemini-pro") == "gemini/gemini-pro"
+        assert normalize_model_name("gemini-pro", prefer_oauth=True) == "gemini_cli/gemini-pro"
 
 
 class TestConfigKeyLoading:
@@ -200,7 +211,7 @@ class TestBackwardCompatibility:
             import src.rotator_client as rc
             
             rc._rotating_client = None
-            rc._initialization_attempted = False
+            rc._last_init_attempt_ts = None
             
             async def check():
                 client = await rc.get_rotating_client()
@@ -272,7 +283,7 @@ class TestRotatorClientSingleton:
         # Reset singleton state
         import src.rotator_client as rc
         rc._rotating_client = None
-        rc._initialization_attempted = False
+        rc._last_init_attempt_ts = None
         
         original = config.ENABLE_ROTATOR
         config.ENABLE_ROTATOR = False
@@ -291,7 +302,7 @@ class TestRotatorClientSingleton:
         
         # Reset singleton state
         rc._rotating_client = None
-        rc._initialization_attempted = False
+        rc._last_init_attempt_ts = None
         
         original = config.ENABLE_ROTATOR
         config.ENABLE_ROTATOR = True
@@ -307,7 +318,29 @@ class TestRotatorClientSingleton:
             pass  # Expected in some cases
         finally:
             config.ENABLE_ROTATOR = original
-            rc._initialization_attempted = False
+            rc._last_init_attempt_ts = None
+    
+    @pytest.mark.asyncio
+    async def test_failed_init_not_retried_within_window(self):
+        """Test that a recent failed initialization is not retried immediately."""
+        import time
+        from src.config import config
+        import src.rotator_client as rc
+        
+        rc._rotating_client = None
+        rc._last_init_attempt_ts = time.monotonic()
+        
+        original = config.ENABLE_ROTATOR
+        config.ENABLE_ROTATOR = True
+        
+        try:
+            with patch.object(config, 'load_rotator_keys') as mock_load:
+                client = await rc.get_rotating_client()
+                assert client is None
+                mock_load.assert_not_called()
+        finally:
+            config.ENABLE_ROTATOR = original
+            rc._last_init_attempt_ts = None
     
     @pytest.mark.asyncio
     async def test_singleton_returns_same_instance(self):
@@ -347,6 +380,39 @@ class TestKeyPoolStatus:
         assert status["rotator_enabled"] == True
         assert status["key_counts"].get("openai") == 2
         assert status["key_counts"].get("gemini") == 1
+    
+    @pytest.mark.asyncio
+    async def test_key_pool_status_cached_until_invalidated(self):
+        """Test that the pool status is cached and refreshed on invalidation."""
+        from src.rotator_client import get_key_pool_status, invalidate_key_pool_cache
+        from src.config import Config
+        
+        invalidate_key_pool_cache()
+        with patch.object(Config, 'load_rotator_keys') as mock_load:
+            Config.ROTATOR_API_KEYS = {"openai": ["key1"]}
+            Config.ROTATOR_OAUTH_CREDENTIALS = {}
+            
+            first = await get_key_pool_status()
+            Config.ROTATOR_API_KEYS = {"openai": ["key1", "key2"]}
+            second = await get_key_pool_status()
+            
+            assert mock_load.call_count == 1
+            assert second["key_counts"] == first["key_counts"] == {"openai": 1}
+            
+            # Mutating a returned status must not corrupt the cached one
+            first["key_counts"]["openai"] = 99
+            first["providers"].append("bogus")
+            cached = await get_key_pool_status()
+            assert cached["key_counts"] == {"openai": 1}
+            assert "bogus" not in cached["providers"]
+            
+            invalidate_key_pool_cache()
+            third = await get_key_pool_status()
+            
+            assert mock_load.call_count == 2
+            assert third["key_counts"] == {"openai": 2}
+        
+        invalidate_key_pool_cache()
 
 
 class TestUsageTracking:
@@ -419,6 +485,54 @@ class TestUsageTracking:
         finally:
             config.ROTATOR_USAGE_FILE_PATH = original
             os.unlink(temp_path)
+    
+    def test_usage_stats_cached_until_file_changes(self):
+        """Test that usage stats are re-read only when the file changes."""
+        from src.rotator_client import get_usage_summary, load_usage_stats
+        from src.config import config
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"key1": {"provider": "openai", "requests": 1}}, f)
+            temp_path = f.name
+        
+        original = config.ROTATOR_USAGE_FILE_PATH
+        config.ROTATOR_USAGE_FILE_PATH = temp_path
+        
+        try:
+            with patch("src.rotator_client.json.load", wraps=json.load) as json_load:
+                assert load_usage_stats() == load_usage_stats()
+                assert get_usage_summary()["total_requests"] == 1
+                assert json_load.call_count == 1
+            
+            with open(temp_path, 'w') as f:
+                json.dump({"key1": {"provider": "openai", "requests": 12}}, f)
+            
+            assert get_usage_summary()["total_requests"] == 12
+        finally:
+            config.ROTATOR_USAGE_FILE_PATH = original
+            os.unlink(temp_path)
+    
+    def test_usage_stats_results_do_not_alias_cache(self):
+        """Test that mutating returned usage data leaves the cache intact."""
+        from src.rotator_client import get_usage_summary, load_usage_stats
+        from src.config import config
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"key1": {"provider": "openai", "requests": 3}}, f)
+            temp_path = f.name
+        
+        original = config.ROTATOR_USAGE_FILE_PATH
+        config.ROTATOR_USAGE_FILE_PATH = temp_path
+        
+        try:
+            load_usage_stats()["key1"]["requests"] = 999
+            assert load_usage_stats()["key1"]["requests"] == 3
+            
+            get_usage_summary()["by_provider"]["openai"]["requests"] = 999
+            assert get_usage_summary()["by_provider"]["openai"]["requests"] == 3
+        finally:
+            config.ROTATOR_USAGE_FILE_PATH = original
+            os.unlink(temp_path)
 
 
 class TestRotatingCompletion:
@@ -432,7 +546,7 @@ class TestRotatingCompletion:
         
         # Reset singleton and disable rotator
         rc._rotating_client = None
-        rc._initialization_attempted = False
+        rc._last_init_attempt_ts = None
         original = config.ENABLE_ROTATOR
         config.ENABLE_ROTATOR = False
         config.LLM_API_KEY = "test-key"
@@ -466,7 +580,7 @@ class TestRotatingCompletion:
         import src.rotator_client as rc
         
         rc._rotating_client = None
-        rc._initialization_attempted = False
+        rc._last_init_attempt_ts = None
         original_rotator = config.ENABLE_ROTATOR
         original_model = config.LLM_MODEL_NAME
         config.ENABLE_ROTATOR = False
@@ -505,7 +619,7 @@ class TestAnthropicCompatibility:
         import src.rotator_client as rc
         
         rc._rotating_client = None
-        rc._initialization_attempted = False
+        rc._last_init_attempt_ts = None
         config.ENABLE_ROTATOR = False
         config.LLM_API_KEY = "test-key"
         
@@ -582,6 +696,52 @@ class TestTokenCounting:
             {"role": "assistant", "content": "Hi there!"}
         ])
         assert count > 0
+    
+    def test_token_count_memoized(self):
+        """Test that repeated counts for the same input are served from cache."""
+        import src.rotator_client as rc
+        
+        rc._token_count_cached.cache_clear()
+        with patch.object(rc, '_token_count_impl', return_value=7) as mock_impl:
+            assert rc.token_count("gpt-4o", text="same prompt") == 7
+            assert rc.token_count("gpt-4o", text="same prompt") == 7
+            assert mock_impl.call_count == 1
+            
+            messages = [{"role": "user", "content": "Hello"}]
+            rc.token_count("gpt-4o", messages=messages)
+            rc.token_count("gpt-4o", messages=list(messages))
+            assert mock_impl.call_count == 2
+            
+            # Messages with extra fields are never cached
+            tool_msg = [{"role": "tool", "content": "ok", "tool_call_id": "1"}]
+            rc.token_count("gpt-4o", messages=tool_msg)
+            rc.token_count("gpt-4o", messages=tool_msg)
+            assert mock_impl.call_count == 4
+            
+            # Two-key messages other than role/content, and role-less ones, are not cached
+            call_msg = [{"role": "assistant", "tool_calls": [{"id": "1"}]}]
+            rc.token_count("gpt-4o", messages=call_msg)
+            rc.token_count("gpt-4o", messages=call_msg)
+            assert mock_impl.call_count == 6
+            
+            no_role = [{"content": "Hello"}]
+            rc.token_count("gpt-4o", messages=no_role)
+            rc.token_count("gpt-4o", messages=no_role)
+            assert mock_impl.call_count == 8
+        rc._token_count_cached.cache_clear()
+    
+    def test_token_count_estimate_not_memoized(self):
+        """Test that the length estimate is not cached when no tokenizer works."""
+        import src.rotator_client as rc
+        
+        rc._token_count_cached.cache_clear()
+        with patch.object(rc, '_token_count_impl', return_value=None):
+            assert rc.token_count("gpt-4o", text="x" * 40) == 10
+        
+        with patch.object(rc, '_token_count_impl', return_value=3) as mock_impl:
+            assert rc.token_count("gpt-4o", text="x" * 40) == 3
+            assert mock_impl.call_count == 1
+        rc._token_count_cached.cache_clear()
 
 
 # Run with: pytest tests/test_rotator_integration.py -v
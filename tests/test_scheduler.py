@@ -0,0 +1,178 @@
+"""
+Tests for the ReminderScheduler polling loop.
+
+Database queries and the Discord client are mocked, so these run offline.
+"""
+
+import pytest
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, AsyncMock, patch
+
+import sys
+import os
+
+# Setup path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Mock external dependencies before importing src modules
+sys.modules['zep_cloud'] = MagicMock()
+sys.modules['zep_cloud.client'] = MagicMock()
+sys.modules['zep_cloud.types'] = MagicMock()
+sys.modules['supabase'] = MagicMock()
+sys.modules['exa_py'] = MagicMock()
+sys.modules['rotator_library'] = MagicMock()
+
+import discord
+
+from src.config import config
+from src.scheduler import ReminderScheduler
+
+
+def _response(data):
+    """Build a mock PostgREST response."""
+    response = MagicMock()
+    response.data = data
+    return response
+
+
+def _scheduler(user=None, fetch_error=None) -> ReminderScheduler:
+    """Build a scheduler around a mock Discord client."""
+    client = MagicMock()
+    client.get_user = MagicMock(return_value=user)
+    client.fetch_user = AsyncMock(side_effect=fetch_error, return_value=user)
+    return ReminderScheduler(client)
+
+
+class TestBackoff:
+    """Tests for the idle backoff schedule."""
+
+    def test_next_interval_grows_and_caps(self):
+        scheduler = _scheduler()
+        base = config.REMINDER_POLL_BASE_INTERVAL
+
+        assert scheduler._next_interval(0) == base
+        assert scheduler._next_interval(1) == min(base * 2, config.REMINDER_POLL_MAX_INTERVAL)
+        assert scheduler._next_interval(scheduler.MAX_BACKOFF_STEPS) == config.REMINDER_POLL_MAX_INTERVAL
+
+    @pytest.mark.asyncio
+    async def test_run_backs_off_while_idle_and_resets_after_sending(self):
+        scheduler = _scheduler()
+        sent_counts = iter([0, 0, 0, 1, 0])
+        intervals = []
+
+        async def fake_sleep(seconds):
+            intervals.append(seconds)
+            if len(intervals) == 5:
+                scheduler.running = False
+
+        with patch.object(scheduler, "check_and_send_reminders", AsyncMock(side_effect=lambda: next(sent_counts))), \
+             patch.object(scheduler, "seconds_until_next_reminder", AsyncMock(return_value=None)), \
+             patch.object(scheduler, "_sleep", side_effect=fake_sleep):
+            await scheduler.run()
+
+        assert intervals == [
+            scheduler._next_interval(1),
+            scheduler._next_interval(2),
+            scheduler._next_interval(3),
+            scheduler._next_interval(0),
+            scheduler._next_interval(1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_run_never_sleeps_past_next_reminder(self):
+        scheduler = _scheduler()
+
+        async def fake_sleep(seconds):
+            scheduler.running = False
+            fake_sleep.seconds = seconds
+
+        with patch.object(scheduler, "check_and_send_reminders", AsyncMock(return_value=0)), \
+             patch.object(scheduler, "seconds_until_next_reminder", AsyncMock(return_value=0.5)), \
+             patch.object(scheduler, "_sleep", side_effect=fake_sleep):
+            await scheduler.run()
+
+        assert fake_sleep.seconds == 0.5
+
+    @pytest.mark.asyncio
+    async def test_failed_reminder_does_not_count_as_activity(self):
+        scheduler = _scheduler(fetch_error=RuntimeError("Discord unavailable"))
+        run_query = AsyncMock(return_value=_response([{"id": 1, "user_id": 42, "message": "hi"}]))
+
+        with patch("src.scheduler.run_query", run_query):
+            sent = await scheduler.check_and_send_reminders()
+
+        assert sent == 0
+        # Only the due-reminders SELECT ran; nothing was marked as sent
+        assert run_query.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_deleted_user_reminder_is_marked_sent(self):
+        not_found = discord.NotFound(MagicMock(status=404, reason="Not Found"), "Unknown User")
+        scheduler = _scheduler(fetch_error=not_found)
+        run_query = AsyncMock(return_value=_response([{"id": 1, "user_id": 42, "message": "hi"}]))
+
+        with patch("src.scheduler.run_query", run_query):
+            sent = await scheduler.check_and_send_reminders()
+
+        assert sent == 1
+        assert run_query.await_count == 2
+
+
+class TestNotify:
+    """Tests for waking the loop early."""
+
+    @pytest.mark.asyncio
+    async def test_notify_cuts_sleep_short(self):
+        scheduler = _scheduler()
+
+        asyncio.get_running_loop().call_later(0.01, scheduler.notify)
+        await asyncio.wait_for(scheduler._sleep(30), timeout=1)
+
+        assert not scheduler._wake.is_set()
+
+    @pytest.mark.asyncio
+    async def test_sleep_times_out_without_notify(self):
+        scheduler = _scheduler()
+
+        await scheduler._sleep(0.01)
+
+        assert not scheduler._wake.is_set()
+
+
+class TestSecondsUntilNextReminder:
+    """Tests for the next-due lookup."""
+
+    @pytest.mark.asyncio
+    async def test_no_pending_reminders(self):
+        scheduler = _scheduler()
+
+        with patch("src.scheduler.run_query", AsyncMock(return_value=_response([]))):
+            assert await scheduler.seconds_until_next_reminder() is None
+
+    @pytest.mark.asyncio
+    async def test_seconds_until_future_reminder(self):
+        scheduler = _scheduler()
+        due = (datetime.now(timezone.utc) + timedelta(seconds=120)).isoformat()
+
+        with patch("src.scheduler.run_query", AsyncMock(return_value=_response([{"remind_time": due}]))):
+            seconds = await scheduler.seconds_until_next_reminder()
+
+        assert 110 < seconds <= 120
+
+    @pytest.mark.asyncio
+    async def test_naive_time_treated_as_utc(self):
+        scheduler = _scheduler()
+        due = (datetime.now(timezone.utc) + timedelta(seconds=60)).replace(tzinfo=None).isoformat()
+
+        with patch("src.scheduler.run_query", AsyncMock(return_value=_response([{"remind_time": due}]))):
+            seconds = await scheduler.seconds_until_next_reminder()
+
+        assert 50 < seconds <= 60
+
+    @pytest.mark.asyncio
+    async def test_lookup_error_returns_none(self):
+        scheduler = _scheduler()
+
+        with patch("src.scheduler.run_query", AsyncMock(side_effect=RuntimeError("db down"))):
+            assert await scheduler.seconds_until_next_reminder() is None
@@ -146,6 +146,35 @@ Content.
         """Test loading from a nonexistent file."""
         skill = load_skill_from_file('/nonexistent/SKILL.md', 'global')
         assert skill is None
+    
+    def test_reload_uses_cache_until_modified(self, skill_dir):
+        """Test that an unchanged file is served from cache and edits are picked up."""
+        first = load_skill_from_file(skill_dir, 'global')
+        assert load_skill_from_file(skill_dir, 'global') is first
+        
+        with open(skill_dir, 'w') as f:
+            f.write("""---
+name: renamed-skill
+description: Edited
+---
+""")
+        st = os.stat(skill_dir)
+        os.utime(skill_dir, (st.st_atime, st.st_mtime + 1))
+        
+        skill = load_skill_from_file(skill_dir, 'global')
+        assert skill.name == 'renamed-skill'
+    
+    def test_reload_detects_size_change_with_same_mtime(self, skill_dir):
+        """Test that an edit is picked up even if the mtime is unchanged."""
+        load_skill_from_file(skill_dir, 'global')
+        st = os.stat(skill_dir)
+        
+        with open(skill_dir, 'w') as f:
+            f.write("---\nname: other\n---\n")
+        os.utime(skill_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        skill = load_skill_from_file(skill_dir, 'global')
+        assert skill.name == 'other'
 
 
 # --- Directory Loading Tests ---